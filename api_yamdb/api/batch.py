@@ -0,0 +1,97 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.urls import Resolver404, resolve
+from rest_framework import permissions
+from rest_framework.response import Response
+
+BATCH_URL_NAME = "batch"
+
+
+def build_request(request, method, url, body):
+    path, _, query = url.partition("?")
+    payload = b"" if body is None else json.dumps(body).encode()
+    environ = {
+        **request.META,
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "CONTENT_TYPE": "application/json",
+        # Тела ответов вкладываются в общий ответ как JSON, в каком бы
+        # формате ни был запрошен сам пакет.
+        "HTTP_ACCEPT": "application/json",
+        "CONTENT_LENGTH": str(len(payload)),
+        "wsgi.input": BytesIO(payload),
+    }
+    sub_request = WSGIRequest(environ)
+    # Пользователь уже аутентифицирован внешним запросом: вложенные
+    # запросы не разбирают токен и не читают пользователя заново.
+    if request.user.is_authenticated:
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def response_body(response):
+    # Ответ DRF ещё не отрисован: тело берётся из data (у 204 — None).
+    if isinstance(response, Response):
+        return response.data
+    if not response.content:
+        return None
+    try:
+        return json.loads(response.content)
+    except ValueError:
+        return response.content.decode(errors="replace")
+
+
+def dispatch(request, item):
+    path = item["url"].partition("?")[0]
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return {"status": 404, "body": {"detail": "Страница не найдена."}}
+    if match.url_name == BATCH_URL_NAME:
+        return {
+            "status": 400,
+            "body": {"detail": "Пакетные запросы нельзя вкладывать."},
+        }
+    sub_request = build_request(
+        request, item["method"], item["url"], item.get("body")
+    )
+    sub_request.resolver_match = match
+    response = match.func(sub_request, *match.args, **match.kwargs)
+    return {"status": response.status_code, "body": response_body(response)}
+
+
+def dispatch_read(request, item):
+    try:
+        return dispatch(request, item)
+    finally:
+        connections.close_all()
+
+
+def run_batch(request, items):
+    # Подряд идущие чтения выполняются параллельно, запись — по порядку,
+    # чтобы чтение после записи видело её результат.
+    results = [None] * len(items)
+    reads = []
+
+    def collect_reads():
+        for index, future in reads:
+            results[index] = future.result()
+        reads.clear()
+
+    with ThreadPoolExecutor(settings.BATCH_MAX_WORKERS) as pool:
+        for index, item in enumerate(items):
+            if item["method"] in permissions.SAFE_METHODS:
+                future = pool.submit(dispatch_read, request, item)
+                reads.append((index, future))
+                continue
+            collect_reads()
+            results[index] = dispatch(request, item)
+        collect_reads()
+    return results
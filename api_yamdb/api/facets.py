@@ -0,0 +1,44 @@
+from django.db.models import Count, F, IntegerField
+from django.db.models.functions import Cast, Mod
+
+from reviews.models import Category, Genre, Title
+
+
+def count_titles_by_slug(model, title_ids):
+    return list(
+        model.objects.filter(titles__in=title_ids)
+        .values("slug", "name")
+        .annotate(count=Count("titles"))
+        .order_by("name")
+    )
+
+
+def count_titles_by_years(title_ids, year_bucket):
+    years = (
+        Title.objects.filter(pk__in=title_ids)
+        .order_by()
+        .annotate(
+            # MOD в SQLite возвращает вещественное число.
+            start=Cast(F("year") - Mod("year", year_bucket), IntegerField())
+        )
+        .values("start")
+        .annotate(count=Count("pk"))
+        .order_by("start")
+    )
+    return [
+        {
+            "from": year["start"],
+            "to": year["start"] + year_bucket - 1,
+            "count": year["count"],
+        }
+        for year in years
+    ]
+
+
+def get_title_facets(queryset, year_bucket=10):
+    title_ids = queryset.order_by().values("pk")
+    return {
+        "genre": count_titles_by_slug(Genre, title_ids),
+        "category": count_titles_by_slug(Category, title_ids),
+        "year": count_titles_by_years(title_ids, year_bucket),
+    }
@@ -1,13 +1,146 @@
-from django_filters.rest_framework import CharFilter, FilterSet
+from django import forms
+from django.db.models import Exists, OuterRef
+from django_filters.constants import EMPTY_VALUES
+from django_filters.rest_framework import (
+    BaseInFilter,
+    CharFilter,
+    ChoiceFilter,
+    FilterSet,
+    NumberFilter,
+)
+from rest_framework.filters import OrderingFilter
 
-from reviews.models import Title
+from reviews.bitmaps import ids_subquery, title_index
+from reviews.models import Review, Title
+from reviews.slugs import category_slugs, genre_slugs
+
+from .pagination import with_pk
+
+
+class SlugInFilter(BaseInFilter, CharFilter):
+    pass
+
+
+class IntegerFilter(NumberFilter):
+    field_class = forms.IntegerField
+
+
+class StableOrderingFilter(OrderingFilter):
+    # id в конце сортировки не даёт строкам с равными значениями
+    # переезжать между страницами.
+    def get_ordering(self, request, queryset, view):
+        return with_pk(super().get_ordering(request, queryset, view) or ())
 
 
 class TitlesFilter(FilterSet):
+    MATCH_ANY = "any"
+    MATCH_ALL = "all"
+    MATCH_CHOICES = ((MATCH_ANY, "any"), (MATCH_ALL, "all"))
+
     name = CharFilter(field_name="name", lookup_expr="contains")
-    category = CharFilter(field_name="category__slug", lookup_expr="contains")
-    genre = CharFilter(field_name="genre__slug", lookup_expr="contains")
+    category = SlugInFilter(method="filter_category")
+    genre = SlugInFilter(method="filter_genre")
+    genre_match = ChoiceFilter(
+        choices=MATCH_CHOICES, method="filter_genre_match"
+    )
+    # Границы рейтинга целые, как рейтинг в ответе.
+    rating_min = IntegerFilter(field_name="rating", lookup_expr="gte")
+    rating_max = IntegerFilter(method="filter_rating_max")
+    reviews_min = NumberFilter(field_name="reviews_count", lookup_expr="gte")
+
+    INDEXED_FILTERS = ("category", "genre", "genre_match", "year")
 
     class Meta:
         model = Title
         fields = ("name", "category", "genre", "year")
+
+    def filter_queryset(self, queryset):
+        if not title_index.enabled:
+            return super().filter_queryset(queryset)
+        data = self.form.cleaned_data
+        bitmap = None
+        if any(data.get(name) for name in self.INDEXED_FILTERS):
+            bitmap = self.select_bitmap()
+            queryset = queryset.filter(pk__in=ids_subquery(bitmap))
+        for name, value in data.items():
+            if name not in self.INDEXED_FILTERS and value not in EMPTY_VALUES:
+                queryset = self.filters[name].filter(queryset, value)
+                bitmap = None
+        if self.request is not None:
+            # Число строк пагинация возьмёт из карты, если других
+            # фильтров нет.
+            self.request.title_bitmap = bitmap
+        return queryset
+
+    def select_bitmap(self):
+        data = self.form.cleaned_data
+        genres = categories = years = None
+        if data.get("genre"):
+            slugs = set(data["genre"])
+            genres = genre_slugs.ids(slugs)
+            if len(genres) < len(slugs):
+                # Неизвестный slug даёт пустую карту жанра.
+                genres.append(None)
+        if data.get("category"):
+            categories = category_slugs.ids(data["category"])
+        if data.get("year") is not None:
+            years = [int(data["year"])]
+        return title_index.select(
+            genres=genres,
+            genres_all=data.get("genre_match") == self.MATCH_ALL,
+            categories=categories,
+            years=years,
+        )
+
+    def filter_category(self, queryset, name, value):
+        return queryset.filter(category_id__in=category_slugs.ids(value))
+
+    def filter_genre(self, queryset, name, value):
+        slugs = set(value)
+        genre_ids = genre_slugs.ids(slugs)
+        title_genres = Title.genre.through.objects.filter(
+            title_id=OuterRef("pk")
+        )
+        if self.form.cleaned_data.get("genre_match") != self.MATCH_ALL:
+            return queryset.filter(
+                Exists(title_genres.filter(genre_id__in=genre_ids))
+            )
+        if len(genre_ids) < len(slugs):
+            return queryset.none()
+        for genre_id in genre_ids:
+            queryset = queryset.filter(
+                Exists(title_genres.filter(genre_id=genre_id))
+            )
+        return queryset
+
+    def filter_genre_match(self, queryset, name, value):
+        return queryset
+
+    def filter_rating_max(self, queryset, name, value):
+        # В ответе рейтинг округляется вниз: 7.5 подходит под rating_max=7.
+        return queryset.filter(rating__gt=0, rating__lt=value + 1)
+
+
+class ReviewsFilter(FilterSet):
+    category = SlugInFilter(method="filter_category")
+    genre = SlugInFilter(method="filter_genre")
+
+    class Meta:
+        model = Review
+        fields = ("category", "genre")
+
+    # Коррелированные подзапросы не дают планировщику сменить ведущую
+    # таблицу, и лента читается по индексу pub_date без сортировки.
+    def filter_category(self, queryset, name, value):
+        titles = Title.objects.filter(
+            pk=OuterRef("title_id"),
+            category_id__in=category_slugs.ids(value),
+        )
+        return queryset.filter(Exists(titles))
+
+    def filter_genre(self, queryset, name, value):
+        title_genres = Title.genre.through.objects.filter(
+            title_id=OuterRef("title_id"),
+            genre_id__in=genre_slugs.ids(value),
+        )
+        return queryset.filter(Exists(title_genres))
@@ -0,0 +1,135 @@
+import csv
+import os
+import timeit
+from collections import defaultdict
+from io import BytesIO
+from itertools import cycle, islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import MessagePackParser, ORJSONParser
+from api.renderers import MessagePackRenderer, ORJSONRenderer
+
+DATA_DIR = os.path.join(settings.BASE_DIR, "static", "data")
+
+FORMATS = (
+    ("json", JSONRenderer(), JSONParser()),
+    ("orjson", ORJSONRenderer(), ORJSONParser()),
+    ("msgpack", MessagePackRenderer(), MessagePackParser()),
+)
+
+
+def read_csv(name):
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+def load_dataset():
+    categories = {
+        row["id"]: {"name": row["name"], "slug": row["slug"]}
+        for row in read_csv("category.csv")
+    }
+    genres = {
+        row["id"]: {"name": row["name"], "slug": row["slug"]}
+        for row in read_csv("genre.csv")
+    }
+    title_genres = defaultdict(list)
+    for row in read_csv("genre_title.csv"):
+        title_genres[row["title_id"]].append(genres[row["genre_id"]])
+    users = {row["id"]: row["username"] for row in read_csv("users.csv")}
+    comments = defaultdict(int)
+    for row in read_csv("comments.csv"):
+        comments[row["review_id"]] += 1
+    scores = defaultdict(list)
+    reviews = []
+    for row in read_csv("review.csv"):
+        scores[row["title_id"]].append(int(row["score"]))
+        reviews.append(
+            {
+                "id": int(row["id"]),
+                "text": row["text"],
+                "author": users.get(row["author"], row["author"]),
+                "score": int(row["score"]),
+                "pub_date": row["pub_date"],
+                "comments_count": comments[row["id"]],
+            }
+        )
+    titles = [
+        {
+            "id": int(row["id"]),
+            "name": row["name"],
+            "year": int(row["year"]),
+            "rating": (
+                sum(scores[row["id"]]) // len(scores[row["id"]])
+                if scores[row["id"]] else None
+            ),
+            "description": None,
+            "genre": title_genres[row["id"]],
+            "category": categories.get(row["category"]),
+        }
+        for row in read_csv("titles.csv")
+    ]
+    return titles, reviews
+
+
+def make_page(rows, size):
+    results = [
+        {**row, "id": index}
+        for index, row in enumerate(islice(cycle(rows), size), 1)
+    ]
+    return {
+        "count": size,
+        "next": "http://testserver/api/v1/titles/?page=2",
+        "previous": None,
+        "results": results,
+    }
+
+
+def best_time(func, repeat):
+    number = max(1, repeat // 10)
+    return min(timeit.repeat(func, number=number, repeat=10)) / number
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает рендереры и парсеры API на страницах произведений "
+        "и отзывов из static/data"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=1000,
+            help="сколько объектов на странице",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=100, help="число повторов"
+        )
+
+    def handle(self, *args, **options):
+        titles, reviews = load_dataset()
+        pages = {
+            "titles": make_page(titles, options["page_size"]),
+            "reviews": make_page(reviews, options["page_size"]),
+        }
+        self.stdout.write(
+            f"{'page':<10}{'format':<10}{'bytes':>10}"
+            f"{'render, ms':>14}{'parse, ms':>14}"
+        )
+        for page_name, page in pages.items():
+            for name, renderer, parser in FORMATS:
+                body = renderer.render(page)
+                render = best_time(
+                    lambda: renderer.render(page), options["repeat"]
+                )
+                parse = best_time(
+                    lambda: parser.parse(BytesIO(body)), options["repeat"]
+                )
+                self.stdout.write(
+                    f"{page_name:<10}{name:<10}{len(body):>10}"
+                    f"{render * 1000:>14.3f}{parse * 1000:>14.3f}"
+                )
@@ -0,0 +1,71 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from api.fast_serializers import (
+    FastCommentSerializer,
+    FastReviewSerializer,
+    FastTitleSerializer,
+)
+from api.serializers import (
+    CommentSerializer,
+    ReviewsSerializer,
+    TitleSerializerGet,
+)
+from api.views import TitleViewSet
+from reviews.models import Comment, Review
+
+SERIALIZERS = (
+    ("titles", TitleSerializerGet, FastTitleSerializer(),
+     lambda: TitleViewSet.queryset.all()),
+    ("reviews", ReviewsSerializer, FastReviewSerializer(),
+     lambda: Review.objects.select_related("author")),
+    ("comments", CommentSerializer, FastCommentSerializer(),
+     lambda: Comment.objects.select_related("author")),
+)
+
+
+def best_time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает ModelSerializer и сериализацию из values() на "
+        "списках из базы данных"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=1000,
+            help="сколько объектов сериализовать",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=10, help="число повторов"
+        )
+
+    def handle(self, *args, **options):
+        limit, repeat = options["limit"], options["repeat"]
+        self.stdout.write(
+            f"{'list':<10}{'rows':>8}{'model, us':>14}{'fast, us':>14}"
+        )
+        for name, serializer_class, fast, get_queryset in SERIALIZERS:
+            rows = len(get_queryset()[:limit])
+            if not rows:
+                continue
+            model = best_time(
+                lambda: serializer_class(
+                    get_queryset()[:limit], many=True
+                ).data,
+                repeat,
+            )
+            values = best_time(
+                lambda: fast.serialize(fast.rows(get_queryset()[:limit])),
+                repeat,
+            )
+            self.stdout.write(
+                f"{name:<10}{rows:>8}{model / rows * 1e6:>14.1f}"
+                f"{values / rows * 1e6:>14.1f}"
+            )
@@ -0,0 +1,101 @@
+import gzip
+import hashlib
+import re
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = re.compile(
+    r"^(text/|application/(json|msgpack|javascript|xml|.*\+json|.*yaml))"
+)
+
+
+def compress_body(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(
+        content, compresslevel=settings.GZIP_COMPRESS_LEVEL, mtime=0
+    )
+
+
+def accepted_encodings(request):
+    header = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    encodings = set()
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00"):
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+class CompressedBodyCache:
+    def __init__(self):
+        self.bodies = OrderedDict()
+        self.lock = Lock()
+
+    def get_or_compress(self, content, encoding):
+        key = (encoding, hashlib.blake2b(content, digest_size=16).digest())
+        with self.lock:
+            body = self.bodies.get(key)
+            if body is not None:
+                self.bodies.move_to_end(key)
+                return body
+        body = compress_body(content, encoding)
+        with self.lock:
+            self.bodies[key] = body
+            while len(self.bodies) > settings.COMPRESSION_CACHE_SIZE:
+                self.bodies.popitem(last=False)
+        return body
+
+    def clear(self):
+        with self.lock:
+            self.bodies.clear()
+
+
+compressed_bodies = CompressedBodyCache()
+
+
+# Сжимает ответы gzip или brotli (если модуль установлен). Сжатое тело
+# запоминается по хэшу исходного: одинаковые ответы, например из кэша,
+# сжимаются один раз.
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.is_compressible(response):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        accepted = accepted_encodings(request)
+        if brotli is not None and "br" in accepted:
+            encoding = "br"
+        elif "gzip" in accepted:
+            encoding = "gzip"
+        else:
+            return response
+        body = compressed_bodies.get_or_compress(response.content, encoding)
+        if len(body) >= len(response.content):
+            return response
+        response.content = body
+        response["Content-Length"] = str(len(body))
+        response["Content-Encoding"] = encoding
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
+
+    def is_compressible(self, response):
+        return (
+            not response.streaming
+            and not response.has_header("Content-Encoding")
+            and len(response.content) >= settings.COMPRESSION_MIN_SIZE
+            and COMPRESSIBLE_TYPES.match(response.get("Content-Type", ""))
+        )
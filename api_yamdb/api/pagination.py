@@ -0,0 +1,165 @@
+import datetime
+import json
+from functools import partial
+
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    Cursor,
+    CursorPagination,
+    PageNumberPagination,
+)
+
+
+def with_pk(ordering):
+    names = {name.lstrip("-") for name in ordering}
+    if not ordering or names & {"id", "pk"}:
+        return tuple(ordering)
+    return (*ordering, "-id" if ordering[0].startswith("-") else "id")
+
+
+# DjangoJSONEncoder обрезает время до миллисекунд: строки из той же
+# миллисекунды, что и граница страницы, выпали бы из выдачи.
+class PositionEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def keyset_filter(ordering, position, reverse):
+    # (a, b) > (x, y) раскрывается в a >= x AND (a > x OR a = x AND b > y):
+    # первое условие даёт SQLite начать чтение индекса с позиции курсора.
+    conditions = Q()
+    equal = {}
+    for field, value in zip(ordering, position):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") != reverse else "gt"
+        conditions |= Q(**equal, **{f"{name}__{lookup}": value})
+        equal[name] = value
+    first = ordering[0]
+    lookup = "lte" if first.startswith("-") != reverse else "gte"
+    return Q(**{f"{first.lstrip('-')}__{lookup}": position[0]}) & conditions
+
+
+class BitmapPaginator(Paginator):
+    def __init__(self, object_list, per_page, bitmap, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.bitmap = bitmap
+
+    @cached_property
+    def count(self):
+        return self.bitmap.bit_count()
+
+
+# Если выборку задала битовая карта индекса, COUNT не нужен: число
+# произведений равно числу единичных битов. В SQL уходит только страница.
+class TitlePageNumberPagination(PageNumberPagination):
+    def paginate_queryset(self, queryset, request, view=None):
+        bitmap = getattr(request, "title_bitmap", None)
+        if bitmap is None:
+            self.django_paginator_class = Paginator
+        else:
+            self.django_paginator_class = partial(
+                BitmapPaginator, bitmap=bitmap
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+
+# Курсор хранит значения всех полей сортировки и id. Встроенный курсор
+# DRF помнит только первое поле и смещение среди равных, поэтому на
+# тысяче одинаковых рейтингов перестаёт двигаться.
+class KeysetCursorPagination(CursorPagination):
+    def get_ordering(self, request, queryset, view):
+        return with_pk(super().get_ordering(request, queryset, view))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        position = self.decode_position()
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(
+                name[1:] if name.startswith("-") else f"-{name}"
+                for name in ordering
+            )
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                keyset_filter(self.ordering, position, reverse)
+            )
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        if self.page:
+            self.previous_position = self.encode_position(self.page[0])
+            self.next_position = self.encode_position(self.page[-1])
+        else:
+            self.has_next = self.has_previous = False
+        if self.has_next or self.has_previous:
+            self.display_page_controls = True
+        return self.page
+
+    def decode_position(self):
+        if self.cursor is None or self.cursor.position is None:
+            return None
+        try:
+            position = json.loads(self.cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if (
+            not isinstance(position, list)
+            or len(position) != len(self.ordering)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def encode_position(self, instance):
+        return json.dumps(
+            [
+                self._get_position_value(instance, name.lstrip("-"))
+                for name in self.ordering
+            ],
+            cls=PositionEncoder,
+        )
+
+    @staticmethod
+    def _get_position_value(instance, name):
+        if isinstance(instance, dict):
+            return instance[name]
+        return getattr(instance, name)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=self.next_position)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=self.previous_position)
+        )
+
+
+class TitleCursorPagination(KeysetCursorPagination):
+    ordering = ("name",)
+
+
+class PubDateCursorPagination(KeysetCursorPagination):
+    ordering = ("-pub_date",)
@@ -1,13 +1,40 @@
+from operator import attrgetter
+
+from django.db import models
 from django.shortcuts import get_object_or_404
 
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.slugs import slug_maps
 from users.models import User
 
 
-class UserBasicSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = kwargs.get("context", {}).get("fields")
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    def __init__(self, **kwargs):
+        super().__init__(slug_field="slug", **kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            obj = slug_maps[self.queryset.model].get(data)
+        except TypeError:
+            self.fail("invalid")
+        if obj is None:
+            self.fail("does_not_exist", slug_name="slug", value=data)
+        return obj
+
+
+class UserBasicSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
@@ -29,6 +56,13 @@ class UserCreateSerializer(serializers.ModelSerializer):
 class UserRetrieveUpdateSerializer(UserBasicSerializer):
     role = serializers.ReadOnlyField()
 
+    class Meta(UserBasicSerializer.Meta):
+        fields = UserBasicSerializer.Meta.fields + [
+            "reviews_count",
+            "comments_count",
+        ]
+        read_only_fields = ["reviews_count", "comments_count"]
+
 
 class CustomTokenObtainPairSerializer(serializers.Serializer):
     confirmation_code = serializers.CharField(write_only=True)
@@ -44,7 +78,7 @@ class CustomTokenObtainPairSerializer(serializers.Serializer):
         return attrs
 
 
-class GenreCategorySerializer(serializers.ModelSerializer):
+class GenreCategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     lookup_field = "slug"
 
     class Meta:
@@ -64,12 +98,26 @@ class GenreSerializer(GenreCategorySerializer):
         model = Genre
 
 
-class TitleSerializerGet(serializers.ModelSerializer):
-    rating = serializers.IntegerField(
-        source="reviews__score__avg", read_only=True
-    )
+class NameOrderedListSerializer(serializers.ListSerializer):
+    # Жанры произведений подгружаются без ORDER BY, чтобы SQLite не
+    # сортировал их во временном B-tree; по имени они сортируются здесь.
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+        return super().to_representation(
+            sorted(data, key=attrgetter("name"))
+        )
+
+
+class TitleGenreSerializer(GenreSerializer):
+    class Meta(GenreSerializer.Meta):
+        list_serializer_class = NameOrderedListSerializer
+
+
+class TitleSerializerGet(SparseFieldsMixin, serializers.ModelSerializer):
+    rating = serializers.SerializerMethodField()
     category = CategorySerializer()
-    genre = GenreSerializer(many=True, read_only=True)
+    genre = TitleGenreSerializer(many=True, read_only=True)
 
     class Meta:
         fields = [
@@ -83,21 +131,69 @@ class TitleSerializerGet(serializers.ModelSerializer):
         ]
         model = Title
 
+    def get_rating(self, obj):
+        if not obj.rating:
+            return None
+        return int(obj.rating)
 
-class TitleSerializer(TitleSerializerGet):
-    category = serializers.SlugRelatedField(
-        slug_field="slug", queryset=Category.objects.all()
-    )
-    genre = serializers.SlugRelatedField(
-        many=True, slug_field="slug", queryset=Genre.objects.all()
+
+class TopTitleSerializer(TitleSerializerGet):
+    weighted_rating = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializerGet.Meta):
+        fields = TitleSerializerGet.Meta.fields + ["weighted_rating"]
+
+
+class TrendingTitleSerializer(TitleSerializerGet):
+    activity = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializerGet.Meta):
+        fields = TitleSerializerGet.Meta.fields + ["activity"]
+
+
+class SimilarTitleSerializer(TitleSerializerGet):
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializerGet.Meta):
+        fields = TitleSerializerGet.Meta.fields + ["similarity"]
+
+
+class RecommendedTitleSerializer(TitleSerializerGet):
+    predicted_rating = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializerGet.Meta):
+        fields = TitleSerializerGet.Meta.fields + ["predicted_rating"]
+
+
+class TitleSavedSerializer(TitleSerializerGet):
+    genre = TitleGenreSerializer(
+        many=True, read_only=True, source="saved_genres"
     )
-    rating = serializers.IntegerField(read_only=True)
+
+
+class TitleSerializer(TitleSerializerGet):
+    category = CachedSlugRelatedField(queryset=Category.objects.all())
+    genre = CachedSlugRelatedField(many=True, queryset=Genre.objects.all())
+
+    def create(self, validated_data):
+        self.saved_genres = validated_data.get("genre", [])
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        if "genre" in validated_data:
+            self.saved_genres = validated_data["genre"]
+        else:
+            self.saved_genres = list(instance.genre.all())
+        return super().update(instance, validated_data)
 
     def to_representation(self, value):
-        return TitleSerializerGet(value, context=self.context).data
+        # Категория и жанры уже загружены при валидации, рейтинг хранится
+        # в самом произведении: повторных запросов не нужно.
+        value.saved_genres = self.saved_genres
+        return TitleSavedSerializer(value, context=self.context).data
 
 
-class ReviewsSerializer(serializers.ModelSerializer):
+class ReviewsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field="username",
         read_only=True,
@@ -111,7 +207,9 @@ class ReviewsSerializer(serializers.ModelSerializer):
             "author",
             "score",
             "pub_date",
+            "comments_count",
         ]
+        read_only_fields = ["comments_count"]
         model = Review
 
     def validate(self, data):
@@ -126,7 +224,20 @@ class ReviewsSerializer(serializers.ModelSerializer):
         return data
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class TitleShortSerializer(serializers.ModelSerializer):
+    class Meta:
+        fields = ["id", "name"]
+        model = Title
+
+
+class LatestReviewSerializer(ReviewsSerializer):
+    title = TitleShortSerializer(read_only=True)
+
+    class Meta(ReviewsSerializer.Meta):
+        fields = ReviewsSerializer.Meta.fields + ["title"]
+
+
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field="username",
         read_only=True,
@@ -140,3 +251,35 @@ class CommentSerializer(serializers.ModelSerializer):
             "pub_date",
         ]
         model = Comment
+
+
+class ReviewShortSerializer(serializers.ModelSerializer):
+    title = TitleShortSerializer(read_only=True)
+
+    class Meta:
+        fields = ["id", "title"]
+        model = Review
+
+
+class UserCommentSerializer(CommentSerializer):
+    review = ReviewShortSerializer(read_only=True)
+
+    class Meta(CommentSerializer.Meta):
+        fields = CommentSerializer.Meta.fields + ["review"]
+
+
+class ExpandedReviewSerializer(ReviewsSerializer):
+    comments = CommentSerializer(
+        many=True, read_only=True, source="expanded_comments"
+    )
+
+    class Meta(ReviewsSerializer.Meta):
+        fields = ReviewsSerializer.Meta.fields + ["comments"]
+
+
+class BatchItemSerializer(serializers.Serializer):
+    METHODS = ("GET", "POST", "PATCH", "DELETE")
+
+    method = serializers.ChoiceField(choices=METHODS, default="GET")
+    url = serializers.RegexField(r"^/api/v1/")
+    body = serializers.JSONField(required=False)
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+
+from reviews.versions import get_version, model_version_name
+
+
+# Готовые тела ответов списка одной модели. Все тела принадлежат одной
+# версии модели и сбрасываются, как только версия в кэше меняется.
+class ListSnapshot:
+    def __init__(self, model):
+        self.version_name = model_version_name(model)
+        self.version = None
+        self.bodies = OrderedDict()
+        self.lock = Lock()
+
+    def lookup(self, key):
+        version = get_version(self.version_name)
+        with self.lock:
+            if version != self.version:
+                self.bodies.clear()
+                self.version = version
+                return version, None
+            body = self.bodies.get(key)
+            if body is not None:
+                self.bodies.move_to_end(key)
+            return version, body
+
+    def store(self, version, key, body):
+        with self.lock:
+            if version != self.version:
+                return
+            self.bodies[key] = body
+            while len(self.bodies) > settings.CATALOG_SNAPSHOT_SIZE:
+                self.bodies.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.bodies.clear()
+            self.version = None
@@ -4,9 +4,13 @@ from rest_framework.routers import DefaultRouter
 
 from .views import (
     UserViewSet,
+    BatchView,
+    CacheStatsView,
+    CatalogAnalyticsView,
     CategoryViewSet,
     CommentViewSet,
     GenreViewSet,
+    LatestReviewsView,
     ReviewsViewSet,
     TitleViewSet,
     CustomTokenObtainPairView,
@@ -41,4 +45,12 @@ auth_urls = [
 urlpatterns = [
     path("", include(router.urls)),
     path("auth/", include(auth_urls)),
+    path("batch/", BatchView.as_view(), name="batch"),
+    path(
+        "reviews/latest/", LatestReviewsView.as_view(), name="latest-reviews"
+    ),
+    path(
+        "analytics/", CatalogAnalyticsView.as_view(), name="catalog-analytics"
+    ),
+    path("cache/", CacheStatsView.as_view(), name="cache-stats"),
 ]
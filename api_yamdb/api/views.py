@@ -1,21 +1,42 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db.models import F, OuterRef, Prefetch, Subquery
 from django.shortcuts import get_object_or_404
 
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.filters import SearchFilter
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-from reviews.models import Category, Genre, Review, Title
+from reviews.analytics import get_catalog_analytics
+from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.recommendations import get_recommendations
+from reviews.trending import WINDOWS as TRENDING_WINDOWS, trending_titles
 from users.models import User
 
-from .filters import TitlesFilter
+from .batch import run_batch
+from .facets import get_title_facets
+from .fast_serializers import (
+    FastCategoryGenreSerializer,
+    FastCommentSerializer,
+    FastReviewSerializer,
+    FastTitleSerializer,
+)
+from .filters import ReviewsFilter, StableOrderingFilter, TitlesFilter
+from .pagination import (
+    PubDateCursorPagination,
+    TitleCursorPagination,
+    TitlePageNumberPagination,
+)
 from .permissions import (
     IsAdmin,
     IsAdminOrReadOnly,
@@ -23,22 +44,97 @@ from .permissions import (
 )
 from .serializers import (
     UserBasicSerializer,
+    BatchItemSerializer,
     CategorySerializer,
     CommentSerializer,
     CustomTokenObtainPairSerializer,
+    ExpandedReviewSerializer,
     GenreSerializer,
+    LatestReviewSerializer,
+    RecommendedTitleSerializer,
     ReviewsSerializer,
+    SimilarTitleSerializer,
     TitleSerializer,
     TitleSerializerGet,
+    TopTitleSerializer,
+    TrendingTitleSerializer,
+    UserCommentSerializer,
     UserCreateSerializer,
     UserRetrieveUpdateSerializer,
 )
-from .viewsets import CreateListDestroyViewSet
+from .snapshots import ListSnapshot
+from .viewsets import (
+    CreateListDestroyViewSet,
+    FastListMixin,
+    SnapshotListMixin,
+    SparseFieldsMixin,
+    split_param,
+)
 
 User = get_user_model()
 
 
-class UserViewSet(viewsets.ModelViewSet):
+EXPANSIONS = ("reviews", "reviews.comments")
+
+
+def get_limit(request, max_limit, param="limit"):
+    limit = request.query_params.get(param, str(api_settings.PAGE_SIZE))
+    if not limit.isdigit() or not 0 < int(limit) <= max_limit:
+        raise ValidationError(
+            {param: f"Ожидается целое число от 1 до {max_limit}."}
+        )
+    return int(limit)
+
+
+def get_expansions(request):
+    expand = split_param(request.query_params.get("expand", ""))
+    unknown = expand - set(EXPANSIONS)
+    if unknown:
+        raise ValidationError(
+            {"expand": f"Ожидается одно из значений: {', '.join(EXPANSIONS)}."}
+        )
+    return expand
+
+
+def get_expanded_reviews(title, request):
+    limit = get_limit(
+        request, settings.EXPAND_REVIEWS_LIMIT, "reviews_limit"
+    )
+    reviews = list(title.reviews.select_related("author")[:limit])
+    if "reviews.comments" not in get_expansions(request):
+        return ReviewsSerializer(reviews, many=True).data
+    limit = get_limit(
+        request, settings.EXPAND_COMMENTS_LIMIT, "comments_limit"
+    )
+    # Первые limit комментариев каждого отзыва одним запросом.
+    first_comments = Comment.objects.filter(
+        review_id=OuterRef("review_id")
+    ).values("pk")[:limit]
+    comments = Comment.objects.filter(
+        review_id__in=[review.pk for review in reviews],
+        pk__in=Subquery(first_comments),
+    ).select_related("author").order_by("review_id", "pub_date")
+    by_review = {review.pk: [] for review in reviews}
+    for comment in comments:
+        by_review[comment.review_id].append(comment)
+    for review in reviews:
+        review.expanded_comments = by_review[review.pk]
+    return ExpandedReviewSerializer(reviews, many=True).data
+
+
+def get_titles_for_rows(rows, field):
+    titles = TitleViewSet.queryset.in_bulk([row["title_id"] for row in rows])
+    result = []
+    for row in rows:
+        title = titles.get(row["title_id"])
+        if title is None:
+            continue
+        setattr(title, field, row[field])
+        result.append(title)
+    return result
+
+
+class UserViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = UserBasicSerializer
     queryset = User.objects.all()
     permission_classes = (IsAdmin,)
@@ -79,6 +175,41 @@ class UserViewSet(viewsets.ModelViewSet):
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(methods=["GET"], detail=False,
+            permission_classes=(IsAuthenticated,),
+            url_path="me/recommendations")
+    def recommendations(self, request):
+        limit = get_limit(request, settings.TOP_TITLES_LIMIT)
+        titles = get_titles_for_rows(
+            get_recommendations(request.user.pk)[:limit], "predicted_rating"
+        )
+        serializer = RecommendedTitleSerializer(titles, many=True)
+        return Response(serializer.data)
+
+    def paginate_own(self, queryset, serializer_class):
+        paginator = PubDateCursorPagination()
+        page = paginator.paginate_queryset(
+            queryset.filter(author=self.request.user), self.request, self
+        )
+        serializer = serializer_class(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(methods=["GET"], detail=False,
+            permission_classes=(IsAuthenticated,), url_path="me/reviews")
+    def reviews(self, request):
+        return self.paginate_own(
+            Review.objects.select_related("author", "title"),
+            LatestReviewSerializer,
+        )
+
+    @action(methods=["GET"], detail=False,
+            permission_classes=(IsAuthenticated,), url_path="me/comments")
+    def comments(self, request):
+        return self.paginate_own(
+            Comment.objects.select_related("author", "review__title"),
+            UserCommentSerializer,
+        )
+
 
 class UserCreateView(generics.CreateAPIView):
     permission_classes = (permissions.AllowAny,)
@@ -125,7 +256,47 @@ class CustomTokenObtainPairView(TokenObtainPairView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class CategoryGenreViewSet(CreateListDestroyViewSet):
+class BatchView(APIView):
+    permission_classes = (permissions.AllowAny,)
+
+    def post(self, request):
+        serializer = BatchItemSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+        if not 0 < len(items) <= settings.BATCH_MAX_REQUESTS:
+            raise ValidationError(
+                {
+                    "detail": "Ожидается от 1 до "
+                    f"{settings.BATCH_MAX_REQUESTS} запросов."
+                }
+            )
+        return Response(run_batch(request, items))
+
+
+class CatalogAnalyticsView(APIView):
+    permission_classes = (IsAdmin,)
+
+    def get(self, request):
+        return Response(get_catalog_analytics())
+
+
+class CacheStatsView(APIView):
+    permission_classes = (IsAdmin,)
+
+    def get(self, request):
+        # Счётчики относятся к процессу, который обработал запрос.
+        if not hasattr(cache, "stats"):
+            raise NotFound("Кэш не ведёт статистику.")
+        return Response(cache.stats())
+
+
+class CategoryGenreViewSet(
+    SnapshotListMixin,
+    FastListMixin,
+    SparseFieldsMixin,
+    CreateListDestroyViewSet,
+):
+    fast_serializer = FastCategoryGenreSerializer()
     filter_backends = (SearchFilter,)
     search_fields = ("name",)
     permission_classes = (IsAdminOrReadOnly,)
@@ -134,6 +305,7 @@ class CategoryGenreViewSet(CreateListDestroyViewSet):
 
 class CategoryViewSet(CategoryGenreViewSet):
     queryset = Category.objects.all()
+    snapshot = ListSnapshot(Category)
     serializer_class = CategorySerializer
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend, SearchFilter)
@@ -143,6 +315,7 @@ class CategoryViewSet(CategoryGenreViewSet):
 
 class GenreViewSet(CategoryGenreViewSet):
     queryset = Genre.objects.all()
+    snapshot = ListSnapshot(Genre)
     serializer_class = GenreSerializer
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend, SearchFilter)
@@ -150,24 +323,98 @@ class GenreViewSet(CategoryGenreViewSet):
     lookup_field = "slug"
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(FastListMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = (
-        Title.objects.all().annotate(Avg("reviews__score")).order_by("name")
+        Title.objects.select_related("category")
+        .prefetch_related(
+            Prefetch("genre", queryset=Genre.objects.order_by())
+        )
+        .order_by("name")
     )
     serializer_class = TitleSerializer
+    fast_serializer = FastTitleSerializer()
+    pagination_class = TitlePageNumberPagination
     permission_classes = (IsAdminOrReadOnly,)
-    filter_backends = (DjangoFilterBackend,)
+    filter_backends = (DjangoFilterBackend, StableOrderingFilter)
     filterset_class = TitlesFilter
+    ordering_fields = ("name", "year", "rating", "reviews_count")
+    ordering = ("name",)
     http_method_names = ["get", "post", "patch", "delete"]
 
+    @property
+    def paginator(self):
+        if self.request.query_params.get("pagination") == "cursor":
+            self.pagination_class = TitleCursorPagination
+        return super().paginator
+
     def get_serializer_class(self):
         if self.request.method == "GET":
             return TitleSerializerGet
         return TitleSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        expand = get_expansions(request)
+        title = self.get_object()
+        data = self.get_serializer(title).data
+        if expand:
+            data["reviews"] = get_expanded_reviews(title, request)
+        return Response(data)
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        year_bucket = request.query_params.get("year_bucket", "10")
+        if not year_bucket.isdigit() or int(year_bucket) < 1:
+            raise ValidationError(
+                {"year_bucket": "Ожидается целое положительное число."}
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(get_title_facets(queryset, int(year_bucket)))
+
+    @action(detail=False, methods=["get"])
+    def top(self, request):
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .filter(reviews_count__gt=0)
+            .order_by("-weighted_rating")
+        )
+        limit = get_limit(request, settings.TOP_TITLES_LIMIT)
+        serializer = TopTitleSerializer(queryset[:limit], many=True)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=["get"])
+    def similar(self, request, pk=None):
+        limit = get_limit(request, settings.TOP_TITLES_LIMIT)
+        titles = (
+            self.get_queryset()
+            .filter(similar_to__title_id=pk)
+            .annotate(similarity=F("similar_to__score"))
+            .order_by("-similarity")[:limit]
+        )
+        serializer = SimilarTitleSerializer(titles, many=True)
+        if not serializer.data:
+            get_object_or_404(Title, pk=pk)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def trending(self, request):
+        window = request.query_params.get("window", "day")
+        if window not in TRENDING_WINDOWS:
+            windows = ", ".join(TRENDING_WINDOWS)
+            raise ValidationError(
+                {"window": f"Ожидается одно из значений: {windows}."}
+            )
+        limit = get_limit(request, settings.TOP_TITLES_LIMIT)
+        trending = get_titles_for_rows(
+            trending_titles(window, limit), "activity"
+        )
+        serializer = TrendingTitleSerializer(trending, many=True)
+        return Response(serializer.data)
 
-class ReviewsViewSet(viewsets.ModelViewSet):
+
+class ReviewsViewSet(FastListMixin, SparseFieldsMixin,
+                     viewsets.ModelViewSet):
     serializer_class = ReviewsSerializer
+    fast_serializer = FastReviewSerializer()
     permission_classes = (IsAuthorOrAdminOrModeratorOrReadOnly,)
     http_method_names = ["get", "post", "patch", "delete"]
 
@@ -175,14 +422,25 @@ class ReviewsViewSet(viewsets.ModelViewSet):
         return get_object_or_404(Title, id=self.kwargs.get("title_id"))
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        return self.get_title().reviews.select_related("author")
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user, title=self.get_title())
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class LatestReviewsView(SparseFieldsMixin, generics.ListAPIView):
+    queryset = Review.objects.select_related("author", "title")
+    serializer_class = LatestReviewSerializer
+    permission_classes = (permissions.AllowAny,)
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = ReviewsFilter
+    pagination_class = PubDateCursorPagination
+
+
+class CommentViewSet(FastListMixin, SparseFieldsMixin,
+                     viewsets.ModelViewSet):
     serializer_class = CommentSerializer
+    fast_serializer = FastCommentSerializer()
     permission_classes = (IsAuthorOrAdminOrModeratorOrReadOnly,)
     http_method_names = ["get", "post", "patch", "delete"]
 
@@ -190,7 +448,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         return get_object_or_404(Review, id=self.kwargs.get("review_id"))
 
     def get_queryset(self):
-        return self.get_review().comments.all()
+        return self.get_review().comments.select_related("author")
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user, review=self.get_review())
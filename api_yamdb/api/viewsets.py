@@ -1,4 +1,11 @@
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.http import HttpResponse
+from django.utils.functional import cached_property
 from rest_framework import mixins, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
 
 class CreateListDestroyViewSet(
@@ -8,3 +15,164 @@ class CreateListDestroyViewSet(
     viewsets.GenericViewSet,
 ):
     pass
+
+
+def split_param(value):
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def flatten_select_related(related, prefix=""):
+    lookups = []
+    for name, nested in related.items():
+        lookups.append(prefix + name)
+        lookups.extend(flatten_select_related(nested, f"{prefix}{name}__"))
+    return lookups
+
+
+def lookup_root(lookup):
+    if isinstance(lookup, Prefetch):
+        lookup = lookup.prefetch_to
+    return lookup.split("__")[0]
+
+
+def get_model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def keep_relations(queryset, relations):
+    select_related = queryset.query.select_related
+    prefetches = queryset._prefetch_related_lookups
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if isinstance(select_related, dict):
+        # select_related() без аргументов подтянул бы все связи.
+        lookups = [
+            lookup
+            for lookup in flatten_select_related(select_related)
+            if lookup_root(lookup) in relations
+        ]
+        if lookups:
+            queryset = queryset.select_related(*lookups)
+    return queryset.prefetch_related(
+        *(lookup for lookup in prefetches if lookup_root(lookup) in relations)
+    )
+
+
+# ?fields= и ?omit= в списках урезают и ответ, и SELECT: ненужные колонки
+# откладываются через only(), ненужные связи не подгружаются.
+class SparseFieldsMixin:
+
+    @cached_property
+    def sparse_fields(self):
+        params = self.request.query_params
+        if getattr(self, "action", "list") != "list" or not (
+            params.get("fields") or params.get("omit")
+        ):
+            return None
+        available = set(self.get_serializer_class()().fields)
+        requested = split_param(params.get("fields", "")) or available
+        omitted = split_param(params.get("omit", ""))
+        unknown = (requested | omitted) - available
+        if unknown:
+            raise ValidationError(
+                {"fields": f"Неизвестные поля: {', '.join(sorted(unknown))}."}
+            )
+        return requested - omitted
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.sparse_fields
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.sparse_fields is None:
+            return queryset
+        return self.project_queryset(queryset)
+
+    def get_ordering_names(self):
+        names = list(getattr(self, "ordering_fields", None) or ())
+        ordering = getattr(self.paginator, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        return {name.lstrip("-") for name in (*names, *ordering)}
+
+    def project_queryset(self, queryset):
+        model = queryset.model
+        serializer_fields = self.get_serializer_class()().fields
+        # Менеджер связи (title.reviews) проставляет title каждой строке:
+        # без его столбца Django догружал бы title_id запросом на строку.
+        columns = {model._meta.pk.name}
+        columns.update(field.name for field in queryset._known_related_objects)
+        relations = set()
+        for name in self.sparse_fields:
+            source = serializer_fields[name].source
+            field = get_model_field(
+                model, name if source == "*" else source.split(".")[0]
+            )
+            if field is None:
+                continue
+            if field.concrete and not field.many_to_many:
+                columns.add(field.name)
+            if field.is_relation:
+                relations.add(field.name)
+        for name in self.get_ordering_names():
+            field = get_model_field(model, name)
+            if field is not None and field.concrete:
+                columns.add(name)
+        return keep_relations(queryset, relations).only(*columns)
+
+
+# Списки без ?fields= сериализуются из строк values() через fast_serializer.
+class FastListMixin:
+    fast_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        if (
+            self.fast_serializer is None
+            or not settings.FAST_LIST_SERIALIZATION
+            or getattr(self, "sparse_fields", None) is not None
+        ):
+            return super().list(request, *args, **kwargs)
+        serializer = self.fast_serializer
+        rows = serializer.rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(rows))
+
+
+# Ответы списка запоминаются готовыми байтами по адресу запроса и формату
+# ответа. В установившемся режиме список отдаётся без запросов к базе.
+class SnapshotListMixin:
+    snapshot = None
+
+    def list(self, request, *args, **kwargs):
+        if (
+            self.snapshot is None
+            or not settings.CATALOG_SNAPSHOTS
+            or request.accepted_renderer.format == "api"
+        ):
+            return super().list(request, *args, **kwargs)
+        key = (request.accepted_media_type, request.build_absolute_uri())
+        version, body = self.snapshot.lookup(key)
+        if body is not None:
+            content, content_type = body
+            return HttpResponse(content, content_type=content_type)
+        response = super().list(request, *args, **kwargs)
+        response.snapshot_key = (version, key)
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        snapshot_key = getattr(response, "snapshot_key", None)
+        if snapshot_key is not None and response.status_code == 200:
+            response.render()
+            self.snapshot.store(
+                *snapshot_key, (response.content, response["Content-Type"])
+            )
+        return response
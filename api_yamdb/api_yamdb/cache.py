@@ -0,0 +1,356 @@
+import fcntl
+import mmap
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+STAMP = struct.Struct("Q")
+
+
+class StampFile:
+    """Счётчики изменений ключей в общем файле, отображённом в память.
+
+    Ключ попадает в один из слотов по crc32. Запись в кэш увеличивает
+    счётчик слота, и все процессы видят это без системных вызовов.
+    """
+
+    def __init__(self, path, slots):
+        self.slots = slots
+        self.lock = threading.Lock()
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        size = slots * STAMP.size
+        if os.fstat(self.fd).st_size < size:
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+
+    def slot(self, key):
+        return zlib.crc32(key.encode()) % self.slots * STAMP.size
+
+    def read(self, slot):
+        return STAMP.unpack_from(self.map, slot)[0]
+
+    def bump(self, *slots):
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                for slot in slots:
+                    STAMP.pack_into(self.map, slot, self.read(slot) + 1)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def bump_all(self):
+        self.bump(*range(0, self.slots * STAMP.size, STAMP.size))
+
+
+class SQLiteStore:
+    CULL_EVERY = 64
+
+    def __init__(self, path, max_entries, cull_frequency):
+        self.path = path
+        self.max_entries = max_entries
+        self.cull_frequency = cull_frequency
+        self.local = threading.local()
+        self.writes = 0
+        with self.connection as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)"
+            )
+
+    @property
+    def connection(self):
+        # Соединение своё у каждого потока и у каждого процесса после fork.
+        pid = os.getpid()
+        if getattr(self.local, "pid", None) != pid:
+            connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.local.connection, self.local.pid = connection, pid
+        return self.local.connection
+
+    def get(self, key, now):
+        row = self.connection.execute(
+            "SELECT value, expires FROM cache WHERE key = ? "
+            "AND (expires IS NULL OR expires > ?)",
+            (key, now),
+        ).fetchone()
+        return row
+
+    def set(self, key, value, expires):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires) "
+            "VALUES (?, ?, ?)",
+            (key, value, expires),
+        )
+        self.wrote()
+
+    def add(self, key, value, expires, now):
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "DELETE FROM cache WHERE key = ? AND expires <= ?", (key, now)
+            )
+            added = connection.execute(
+                "INSERT OR IGNORE INTO cache (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                (key, value, expires),
+            ).rowcount
+        finally:
+            connection.execute("COMMIT")
+        if added:
+            self.wrote()
+        return bool(added)
+
+    def incr(self, key, delta, now):
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT value FROM cache WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Key '{key}' not found")
+            value = pickle.loads(row[0]) + delta
+            connection.execute(
+                "UPDATE cache SET value = ? WHERE key = ?",
+                (pickle.dumps(value, pickle.HIGHEST_PROTOCOL), key),
+            )
+        finally:
+            connection.execute("COMMIT")
+        return value
+
+    def touch(self, key, expires, now):
+        return bool(
+            self.connection.execute(
+                "UPDATE cache SET expires = ? WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (expires, key, now),
+            ).rowcount
+        )
+
+    def delete(self, key):
+        return bool(
+            self.connection.execute(
+                "DELETE FROM cache WHERE key = ?", (key,)
+            ).rowcount
+        )
+
+    def clear(self):
+        self.connection.execute("DELETE FROM cache")
+
+    def count(self):
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM cache"
+        ).fetchone()[0]
+
+    def wrote(self):
+        self.writes += 1
+        if self.writes % self.CULL_EVERY == 0:
+            self.cull()
+
+    def cull(self):
+        connection = self.connection
+        connection.execute(
+            "DELETE FROM cache WHERE expires <= ?", (time.time(),)
+        )
+        excess = self.count() - self.max_entries
+        if excess > 0:
+            # Как в DatabaseCache: удаляется доля записей, раньше всех
+            # истекающих; бессрочные удаляются последними.
+            connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                "ORDER BY expires IS NULL, expires LIMIT ?)",
+                (max(excess, self.max_entries // self.cull_frequency),),
+            )
+
+
+class TwoTierStore:
+    """Общее для процесса хранилище кэша: L1 в памяти поверх L2 в SQLite.
+
+    L1 — LRU из сериализованных значений. Каждая запись помнит счётчик
+    слота своего ключа на момент чтения из L2 и считается устаревшей,
+    как только другой процесс или поток изменил ключ этого слота.
+    """
+
+    def __init__(self, location, options):
+        os.makedirs(location, exist_ok=True)
+        self.l2 = SQLiteStore(
+            os.path.join(location, "cache.sqlite3"),
+            int(options.get("MAX_ENTRIES", 10000)),
+            int(options.get("CULL_FREQUENCY", 3)),
+        )
+        self.stamps = StampFile(
+            os.path.join(location, "stamps"),
+            int(options.get("STAMP_SLOTS", 4096)),
+        )
+        self.l1_max_entries = int(options.get("L1_MAX_ENTRIES", 1024))
+        self.l1 = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = dict.fromkeys(
+            ("l1_hits", "l2_hits", "misses", "evictions", "invalidations"),
+            0,
+        )
+
+    def count(self, name):
+        self.counters[name] += 1
+
+    def get(self, key):
+        slot = self.stamps.slot(key)
+        stamp = self.stamps.read(slot)
+        now = time.time()
+        with self.lock:
+            entry = self.l1.get(key)
+            if entry is not None:
+                value, expires, entry_stamp = entry
+                if entry_stamp == stamp and (expires is None or expires > now):
+                    self.l1.move_to_end(key)
+                    self.count("l1_hits")
+                    return value
+                del self.l1[key]
+                if entry_stamp != stamp:
+                    self.count("invalidations")
+        # Счётчик слота прочитан до L2: запись, случившаяся после чтения,
+        # увеличит его и сделает эту копию в L1 устаревшей.
+        row = self.l2.get(key, now)
+        with self.lock:
+            if row is None:
+                self.count("misses")
+                return None
+            self.count("l2_hits")
+            self.l1[key] = (row[0], row[1], stamp)
+            while len(self.l1) > self.l1_max_entries:
+                self.l1.popitem(last=False)
+                self.count("evictions")
+        return row[0]
+
+    def changed(self, key):
+        self.stamps.bump(self.stamps.slot(key))
+        with self.lock:
+            self.l1.pop(key, None)
+
+    def set(self, key, value, expires):
+        self.l2.set(key, value, expires)
+        self.changed(key)
+
+    def add(self, key, value, expires):
+        added = self.l2.add(key, value, expires, time.time())
+        if added:
+            self.changed(key)
+        return added
+
+    def incr(self, key, delta):
+        value = self.l2.incr(key, delta, time.time())
+        self.changed(key)
+        return value
+
+    def touch(self, key, expires):
+        touched = self.l2.touch(key, expires, time.time())
+        self.changed(key)
+        return touched
+
+    def delete(self, key):
+        deleted = self.l2.delete(key)
+        self.changed(key)
+        return deleted
+
+    def clear(self):
+        self.l2.clear()
+        self.stamps.bump_all()
+        with self.lock:
+            self.l1.clear()
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+            stats["l1_entries"] = len(self.l1)
+        stats["l1_max_entries"] = self.l1_max_entries
+        stats["l2_entries"] = self.l2.count()
+        stats["pid"] = os.getpid()
+        return stats
+
+
+stores = {}
+stores_lock = threading.Lock()
+
+
+def get_store(location, options):
+    with stores_lock:
+        if location not in stores:
+            stores[location] = TwoTierStore(location, options)
+        return stores[location]
+
+
+class TwoTierCache(BaseCache):
+    """Бэкенд кэша Django: LOCATION — каталог с L2 и файлом счётчиков.
+
+    Django создаёт экземпляр бэкенда в каждом потоке, поэтому L1 и
+    соединения с L2 живут в общем для процесса TwoTierStore.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self.store = get_store(location, params.get("OPTIONS", {}))
+
+    def get_key(self, key, version):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return key
+
+    @staticmethod
+    def dumps(value):
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def get(self, key, default=None, version=None):
+        value = self.store.get(self.get_key(key, version))
+        if value is None:
+            return default
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.store.set(
+            self.get_key(key, version),
+            self.dumps(value),
+            self.get_backend_timeout(timeout),
+        )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.store.add(
+            self.get_key(key, version),
+            self.dumps(value),
+            self.get_backend_timeout(timeout),
+        )
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.store.touch(
+            self.get_key(key, version), self.get_backend_timeout(timeout)
+        )
+
+    def incr(self, key, delta=1, version=None):
+        return self.store.incr(self.get_key(key, version), delta)
+
+    def delete(self, key, version=None):
+        return self.store.delete(self.get_key(key, version))
+
+    def has_key(self, key, version=None):
+        return self.store.get(self.get_key(key, version)) is not None
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self):
+        return self.store.stats()
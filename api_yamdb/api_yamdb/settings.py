@@ -30,6 +30,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "api.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -69,6 +70,21 @@ DATABASES = {
     }
 }
 
+# Two-tier cache: per-process LRU (L1) in front of a SQLite file (L2)
+# shared by all workers on the host. Writes bump per-key stamps in a
+# memory-mapped file, so stale L1 copies are dropped in every worker.
+CACHES = {
+    "default": {
+        "BACKEND": "api_yamdb.cache.TwoTierCache",
+        "LOCATION": os.path.join(BASE_DIR, "cache"),
+        "OPTIONS": {
+            "L1_MAX_ENTRIES": 1024,
+            "MAX_ENTRIES": 10000,
+            "STAMP_SLOTS": 4096,
+        },
+    }
+}
+
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
@@ -80,6 +96,17 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
+        "api.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.parsers.ORJSONParser",
+        "api.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 SIMPLE_JWT = {
@@ -87,6 +114,39 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Bayesian prior of the weighted title rating: the rating a title
+# without reviews gets and how many reviews that guess is worth
+TITLE_RATING_PRIOR_MEAN = 5.5
+TITLE_RATING_PRIOR_WEIGHT = 10
+
+TOP_TITLES_LIMIT = 100
+
+# In-memory bitmap index over titles for genre/category/year filters
+TITLE_BITMAP_INDEX = False
+
+# Upper bounds for ?expand=reviews,reviews.comments on a title
+EXPAND_REVIEWS_LIMIT = 50
+EXPAND_COMMENTS_LIMIT = 20
+
+# /api/v1/batch/: sub-requests per call and threads for concurrent reads
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_WORKERS = 4
+
+# Response compression: smallest body worth compressing, compression levels
+# and how many compressed bodies to keep for identical responses
+COMPRESSION_MIN_SIZE = 1024
+GZIP_COMPRESS_LEVEL = 6
+BROTLI_QUALITY = 5
+COMPRESSION_CACHE_SIZE = 256
+
+# Serialize read-only lists straight from values() rows
+FAST_LIST_SERIALIZATION = True
+
+# Pre-rendered /categories/ and /genres/ responses: switch and how many
+# bodies (pages, search terms, formats) to keep per list
+CATALOG_SNAPSHOTS = True
+CATALOG_SNAPSHOT_SIZE = 256
+
 EMAIL_BACKEND = "django.core.mail.backends.filebased.EmailBackend"
 
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, "sent_emails")
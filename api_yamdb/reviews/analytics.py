@@ -0,0 +1,141 @@
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Value
+from django.db.models.functions import Coalesce, ExtractMonth, ExtractYear
+from scipy import sparse
+
+from .models import Category, Genre, Review, Title
+from .versions import get_version
+
+ANALYTICS_VERSION = "catalog_analytics"
+ANALYTICS_KEY = "catalog_analytics:{}"
+MAX_SCORE = 10
+
+
+def load_array(queryset, *fields):
+    return np.array(
+        queryset.values_list(*fields), dtype=np.int64
+    ).reshape(-1, len(fields))
+
+
+def load_slugs(model):
+    ids, slugs = [], []
+    for pk, slug in model.objects.order_by("id").values_list("id", "slug"):
+        ids.append(pk)
+        slugs.append(slug)
+    return np.array(ids, dtype=np.int64), slugs
+
+
+def membership(rows, columns, shape):
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int64), (rows, columns)), shape=shape
+    )
+
+
+def distribution(labels, histograms, key):
+    scores = np.arange(1, MAX_SCORE + 1)
+    reviews = histograms.sum(axis=1)
+    totals = histograms @ scores
+    return [
+        {
+            key: label,
+            "reviews": int(count),
+            "mean": round(float(total) / count, 2) if count else None,
+            "histogram": histogram.tolist(),
+        }
+        for label, count, total, histogram in zip(
+            labels, reviews, totals, histograms
+        )
+    ]
+
+
+def compute_catalog_analytics():
+    titles = load_array(
+        Title.objects.order_by("id"),
+        "id", "year", Coalesce("category_id", Value(0)),
+    )
+    links = load_array(
+        Title.genre.through.objects.order_by(), "title_id", "genre_id"
+    )
+    reviews = load_array(
+        Review.objects.order_by(),
+        "title_id",
+        Coalesce("score", Value(0)),
+        ExtractYear("pub_date"),
+        ExtractMonth("pub_date"),
+    )
+    genre_ids, genre_slugs = load_slugs(Genre)
+    category_ids, category_slugs = load_slugs(Category)
+    title_ids = titles[:, 0]
+
+    # оценки каждого произведения: строка — произведение, столбец — балл
+    review_rows = np.searchsorted(title_ids, reviews[:, 0])
+    scores = np.bincount(
+        review_rows * (MAX_SCORE + 1) + reviews[:, 1],
+        minlength=len(title_ids) * (MAX_SCORE + 1),
+    ).reshape(-1, MAX_SCORE + 1)[:, 1:]
+
+    genres = membership(
+        np.searchsorted(title_ids, links[:, 0]),
+        np.searchsorted(genre_ids, links[:, 1]),
+        (len(title_ids), len(genre_ids)),
+    )
+    pairs = (genres.T @ genres).toarray()
+    first, second = np.triu_indices(len(genre_ids), 1)
+    counts = pairs[first, second]
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+
+    with_category = titles[:, 2] > 0
+    categories = membership(
+        np.flatnonzero(with_category),
+        np.searchsorted(category_ids, titles[with_category, 2]),
+        (len(title_ids), len(category_ids)),
+    )
+    decades, decade_columns = np.unique(
+        titles[:, 1] // 10 * 10, return_inverse=True
+    )
+    by_decade = membership(
+        np.arange(len(title_ids)),
+        decade_columns.ravel(),
+        (len(title_ids), len(decades)),
+    )
+
+    months, volume = np.unique(
+        reviews[:, 2] * 12 + reviews[:, 3] - 1, return_counts=True
+    )
+    return {
+        "titles": len(title_ids),
+        "reviews": len(reviews),
+        "genre_pairs": [
+            {
+                "genres": [genre_slugs[first[pair]],
+                           genre_slugs[second[pair]]],
+                "titles": int(counts[pair]),
+            }
+            for pair in order
+        ],
+        "ratings_by_genre": distribution(
+            genre_slugs, genres.T @ scores, "slug"
+        ),
+        "ratings_by_category": distribution(
+            category_slugs, categories.T @ scores, "slug"
+        ),
+        "ratings_by_decade": distribution(
+            decades.tolist(), by_decade.T @ scores, "decade"
+        ),
+        "reviews_by_month": [
+            {"month": f"{month // 12:04d}-{month % 12 + 1:02d}",
+             "reviews": int(count)}
+            for month, count in zip(months.tolist(), volume)
+        ],
+    }
+
+
+def get_catalog_analytics():
+    key = ANALYTICS_KEY.format(get_version(ANALYTICS_VERSION))
+    analytics = cache.get(key)
+    if analytics is None:
+        analytics = compute_catalog_analytics()
+        cache.set(key, analytics, None)
+    return analytics
@@ -0,0 +1,181 @@
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models.expressions import RawSQL
+
+from .models import Title
+from .versions import bump_version, get_version
+
+INDEX_VERSION = "title_bitmap_index"
+
+
+def to_bitmap(ids):
+    bitmap = 0
+    for title_id in ids:
+        bitmap |= 1 << title_id
+    return bitmap
+
+
+def to_ids(bitmap):
+    bits = bin(bitmap)[:1:-1]
+    ids = []
+    position = bits.find("1")
+    while position != -1:
+        ids.append(position)
+        position = bits.find("1", position + 1)
+    return ids
+
+
+# Список id уходит в SQL одним параметром-массивом JSON: число id в
+# выборке не упирается в лимит переменных SQLite.
+def ids_subquery(bitmap):
+    return RawSQL(
+        "SELECT value FROM json_each(%s)", (json.dumps(to_ids(bitmap)),)
+    )
+
+
+class TitleBitmapIndex:
+    """Битовые карты id произведений по жанрам, категориям и годам.
+
+    Карта хранится в целом числе Python: бит N выставлен, если произведение
+    с id N попадает в выборку. Пересечение фильтров — побитовое «и».
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.version = None
+        self.titles = 0
+        self.genres = defaultdict(int)
+        self.categories = defaultdict(int)
+        self.years = defaultdict(int)
+
+    @property
+    def enabled(self):
+        return getattr(settings, "TITLE_BITMAP_INDEX", False)
+
+    def build(self):
+        titles = 0
+        genres = defaultdict(int)
+        categories = defaultdict(int)
+        years = defaultdict(int)
+        version = get_version(INDEX_VERSION)
+        titles_rows = Title.objects.order_by().values_list(
+            "id", "category_id", "year"
+        )
+        for title_id, category_id, year in titles_rows.iterator():
+            bit = 1 << title_id
+            titles |= bit
+            years[year] |= bit
+            if category_id is not None:
+                categories[category_id] |= bit
+        title_genres = (
+            Title.genre.through.objects.order_by()
+            .values_list("title_id", "genre_id")
+        )
+        for title_id, genre_id in title_genres.iterator():
+            genres[genre_id] |= 1 << title_id
+        with self.lock:
+            self.titles = titles
+            self.genres = genres
+            self.categories = categories
+            self.years = years
+            self.version = version
+
+    def ensure_built(self):
+        if self.version != get_version(INDEX_VERSION):
+            self.build()
+
+    def select(self, genres=None, genres_all=False, categories=None,
+               years=None):
+        self.ensure_built()
+        with self.lock:
+            bitmap = self.titles
+            if genres is not None:
+                bitmaps = [self.genres.get(genre, 0) for genre in genres]
+                if genres_all:
+                    for genre_bitmap in bitmaps:
+                        bitmap &= genre_bitmap
+                else:
+                    bitmap &= self.union(bitmaps)
+            if categories is not None:
+                bitmap &= self.union(
+                    self.categories.get(category, 0)
+                    for category in categories
+                )
+            if years is not None:
+                bitmap &= self.union(
+                    self.years.get(year, 0) for year in years
+                )
+        return bitmap
+
+    @staticmethod
+    def union(bitmaps):
+        result = 0
+        for bitmap in bitmaps:
+            result |= bitmap
+        return result
+
+    def changed(self, update):
+        # Остальные процессы узнают об изменении по номеру версии
+        # и перестраивают индекс при следующем обращении.
+        if not self.enabled:
+            return
+        with self.lock:
+            version = bump_version(INDEX_VERSION)
+            if self.version is not None and version == self.version + 1:
+                update()
+                self.version = version
+            else:
+                self.version = None
+
+    def discard_title(self, title_id):
+        mask = ~(1 << title_id)
+        self.titles &= mask
+        for bitmaps in (self.genres, self.categories, self.years):
+            for key in bitmaps:
+                bitmaps[key] &= mask
+
+    def update_title(self, title_id, category_id, year):
+        def update():
+            bit = 1 << title_id
+            mask = ~bit
+            self.titles |= bit
+            for bitmaps in (self.categories, self.years):
+                for key in bitmaps:
+                    bitmaps[key] &= mask
+            self.years[year] |= bit
+            if category_id is not None:
+                self.categories[category_id] |= bit
+
+        self.changed(update)
+
+    def delete_title(self, title_id):
+        self.changed(lambda: self.discard_title(title_id))
+
+    def add_genres(self, title_ids, genre_ids):
+        def update():
+            bitmap = to_bitmap(title_ids)
+            for genre_id in genre_ids:
+                self.genres[genre_id] |= bitmap
+
+        self.changed(update)
+
+    def remove_genres(self, title_ids, genre_ids=None):
+        def update():
+            mask = ~to_bitmap(title_ids)
+            if genre_ids is None:
+                keys = list(self.genres)
+            else:
+                keys = genre_ids
+            for genre_id in keys:
+                self.genres[genre_id] &= mask
+
+        self.changed(update)
+
+    def delete_key(self, bitmaps_name, key):
+        self.changed(lambda: getattr(self, bitmaps_name).pop(key, None))
+
+
+title_index = TitleBitmapIndex()
@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Comment, Review
+
+User = get_user_model()
+
+
+def change_counter(queryset, field, delta):
+    if delta < 0:
+        queryset = queryset.filter(**{f"{field}__gt": 0})
+    queryset.update(**{field: F(field) + delta})
+
+
+def count_review(review, delta):
+    change_counter(
+        User.objects.filter(pk=review.author_id), "reviews_count", delta
+    )
+
+
+def count_comment(comment, delta):
+    change_counter(
+        Review.objects.filter(pk=comment.review_id), "comments_count", delta
+    )
+    change_counter(
+        User.objects.filter(pk=comment.author_id), "comments_count", delta
+    )
+
+
+def count_subquery(queryset, field):
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def recompute_counters():
+    reviews = Review.objects.update(
+        comments_count=count_subquery(Comment.objects, "review")
+    )
+    users = User.objects.update(
+        reviews_count=count_subquery(Review.objects, "author"),
+        comments_count=count_subquery(Comment.objects, "author"),
+    )
+    return reviews, users
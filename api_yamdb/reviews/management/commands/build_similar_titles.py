@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from reviews.similarity import BATCH_SIZE, NEIGHBOURS, build_similar_titles
+
+
+class Command(BaseCommand):
+    help = "Строит таблицу похожих произведений по оценкам в отзывах"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--neighbours",
+            type=int,
+            default=NEIGHBOURS,
+            help="сколько похожих произведений хранить для каждого",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="сколько строк матрицы сходства считать за один шаг",
+        )
+
+    def handle(self, *args, **options):
+        titles, stored = build_similar_titles(
+            options["neighbours"], options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {stored} neighbours for {titles} titles"
+            )
+        )
@@ -0,0 +1,26 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from reviews.analytics import compute_catalog_analytics
+
+
+class Command(BaseCommand):
+    help = (
+        "Печатает аналитику каталога: пары жанров, распределения оценок "
+        "и число отзывов по месяцам"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--indent", type=int, default=2, help="отступ в JSON"
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            json.dumps(
+                compute_catalog_analytics(),
+                ensure_ascii=False,
+                indent=options["indent"],
+            )
+        )
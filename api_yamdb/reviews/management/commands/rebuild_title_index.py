@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from reviews.bitmaps import INDEX_VERSION, title_index
+from reviews.versions import bump_version
+
+
+class Command(BaseCommand):
+    help = "Перестраивает битовый индекс произведений во всех процессах"
+
+    def handle(self, *args, **options):
+        version = bump_version(INDEX_VERSION)
+        title_index.build()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Index version {version}: "
+                f"{title_index.titles.bit_count()} titles, "
+                f"{len(title_index.genres)} genres, "
+                f"{len(title_index.categories)} categories, "
+                f"{len(title_index.years)} years"
+            )
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from reviews.counters import recompute_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Пересчитывает счётчики комментариев у отзывов и счётчики отзывов "
+        "и комментариев у пользователей"
+    )
+
+    def handle(self, *args, **options):
+        reviews, users = recompute_counters()
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated {reviews} reviews and {users} users")
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from reviews.ratings import RECOMPUTE_BATCH_SIZE, recompute_ratings
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает рейтинги всех произведений по отзывам"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RECOMPUTE_BATCH_SIZE,
+            help="сколько произведений обновлять одним запросом",
+        )
+
+    def handle(self, *args, **options):
+        updated = recompute_ratings(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} titles"))
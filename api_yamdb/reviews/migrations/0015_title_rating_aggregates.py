@@ -0,0 +1,46 @@
+# Generated by Django 3.2 on 2026-10-19 19:32
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def fill_title_aggregates(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    titles = Title.objects.annotate(
+        score_avg=Avg('reviews__score'), score_count=Count('reviews')
+    )
+    for title in titles.iterator():
+        title.rating = title.score_avg or 0
+        title.reviews_count = title.score_count
+        title.save(update_fields=['rating', 'reviews_count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0014_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(default=0, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество отзывов'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['rating'], name='title_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['reviews_count'], name='title_reviews_count_idx'),
+        ),
+        migrations.RunPython(
+            fill_title_aggregates, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 3.2 on 2026-10-19 19:34
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+import reviews.models
+
+
+def fill_weighted_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    mean = settings.TITLE_RATING_PRIOR_MEAN
+    weight = settings.TITLE_RATING_PRIOR_WEIGHT
+    titles = Title.objects.annotate(
+        scores_sum=Sum('reviews__score'),
+        scores_count=Count('reviews__score'),
+    )
+    for title in titles.iterator():
+        title.weighted_rating = (
+            (mean * weight + (title.scores_sum or 0))
+            / (weight + title.scores_count)
+        )
+        title.save(update_fields=['weighted_rating'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0015_title_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='weighted_rating',
+            field=models.FloatField(default=reviews.models.default_weighted_rating, verbose_name='Взвешенный рейтинг'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['weighted_rating'], name='title_weighted_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['category', 'weighted_rating'], name='title_category_weighted_idx'),
+        ),
+        migrations.RunPython(
+            fill_weighted_rating, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 3.2 on 2026-10-19 19:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0016_title_weighted_rating'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TitleActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.DateTimeField(verbose_name='Начало интервала')),
+                ('span', models.PositiveIntegerField(choices=[(3600, 'Час'), (86400, 'День')], verbose_name='Длина интервала, с')),
+                ('reviews_count', models.PositiveIntegerField(default=0, verbose_name='Количество отзывов')),
+                ('title', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_buckets', to='reviews.title')),
+            ],
+            options={
+                'verbose_name': 'Активность произведения',
+                'verbose_name_plural': 'Активность произведений',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='titleactivity',
+            index=models.Index(fields=['span', 'start'], name='activity_span_start_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='titleactivity',
+            constraint=models.UniqueConstraint(fields=('title', 'span', 'start'), name='unique_title_activity_bucket'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -7,6 +8,10 @@ from .validators import validate_year
 User = get_user_model()
 
 
+def default_weighted_rating():
+    return settings.TITLE_RATING_PRIOR_MEAN
+
+
 class CategoryGenreBase(models.Model):
     name = models.CharField(verbose_name="Название", max_length=256)
     slug = models.SlugField(
@@ -16,6 +21,12 @@ class CategoryGenreBase(models.Model):
     class Meta:
         abstract = True
         ordering = ("name",)
+        indexes = [
+            models.Index(
+                fields=["name", "slug"],
+                name="%(app_label)s_%(class)s_name_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -36,7 +47,7 @@ class Genre(CategoryGenreBase):
 class Title(models.Model):
     name = models.CharField(verbose_name="Название", max_length=256)
     year = models.PositiveSmallIntegerField(
-        verbose_name="Дата выхода", db_index=True, validators=[validate_year]
+        verbose_name="Дата выхода", validators=[validate_year]
     )
     description = models.TextField(
         verbose_name="Описание", null=True, blank=True
@@ -53,9 +64,35 @@ class Title(models.Model):
         related_name="titles",
         null=True,
     )
+    rating = models.FloatField(verbose_name="Рейтинг", default=0)
+    reviews_count = models.PositiveIntegerField(
+        verbose_name="Количество отзывов", default=0
+    )
+    weighted_rating = models.FloatField(
+        verbose_name="Взвешенный рейтинг", default=default_weighted_rating
+    )
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            models.Index(fields=["name"], name="title_name_idx"),
+            models.Index(fields=["rating"], name="title_rating_idx"),
+            models.Index(
+                fields=["reviews_count"], name="title_reviews_count_idx"
+            ),
+            models.Index(
+                fields=["weighted_rating"], name="title_weighted_rating_idx"
+            ),
+            models.Index(
+                fields=["category", "weighted_rating"],
+                name="title_category_weighted_idx",
+            ),
+            models.Index(fields=["year", "name"], name="title_year_name_idx"),
+            models.Index(fields=["year"], name="title_year_idx"),
+            models.Index(
+                fields=["category", "name"], name="title_category_name_idx"
+            ),
+        ]
         verbose_name = "Произведение"
         verbose_name_plural = "Произведения"
 
@@ -77,13 +114,27 @@ class Review(models.Model):
         validators=[MinValueValidator(1), MaxValueValidator(10)],
     )
     pub_date = models.DateTimeField("Pub-date", auto_now_add=True)
+    comments_count = models.PositiveIntegerField(
+        verbose_name="Количество комментариев", default=0
+    )
 
     class Meta:
+        ordering = ("pub_date",)
         constraints = [
             models.UniqueConstraint(
                 fields=["author", "title"], name="unique_author_review"
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["title", "pub_date"], name="review_title_pub_date_idx"
+            ),
+            models.Index(fields=["pub_date"], name="review_pub_date_idx"),
+            models.Index(
+                fields=["author", "pub_date"],
+                name="review_author_pub_date_idx",
+            ),
+        ]
         verbose_name = "Отзыв"
         verbose_name_plural = "Отзывы"
 
@@ -99,5 +150,72 @@ class Comment(models.Model):
     pub_date = models.DateTimeField("Pub-date_", auto_now_add=True)
 
     class Meta:
+        ordering = ("pub_date",)
+        indexes = [
+            models.Index(
+                fields=["review", "pub_date"],
+                name="comment_review_pub_date_idx",
+            ),
+            models.Index(
+                fields=["author", "pub_date"],
+                name="comment_author_pub_date_idx",
+            ),
+        ]
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
+
+
+class TitleActivity(models.Model):
+    HOUR = 3600
+    DAY = 86400
+    SPAN_CHOICES = ((HOUR, "Час"), (DAY, "День"))
+
+    title = models.ForeignKey(
+        Title, on_delete=models.CASCADE, related_name="activity_buckets"
+    )
+    start = models.DateTimeField("Начало интервала")
+    span = models.PositiveIntegerField(
+        "Длина интервала, с", choices=SPAN_CHOICES
+    )
+    reviews_count = models.PositiveIntegerField(
+        "Количество отзывов", default=0
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title", "span", "start"],
+                name="unique_title_activity_bucket",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["span", "start"], name="activity_span_start_idx"
+            ),
+        ]
+        verbose_name = "Активность произведения"
+        verbose_name_plural = "Активность произведений"
+
+
+class SimilarTitle(models.Model):
+    title = models.ForeignKey(
+        Title, on_delete=models.CASCADE, related_name="similar_titles"
+    )
+    similar = models.ForeignKey(
+        Title, on_delete=models.CASCADE, related_name="similar_to"
+    )
+    score = models.FloatField("Сходство")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title", "similar"], name="unique_similar_title"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["title", "-score"], name="similar_title_score_idx"
+            ),
+        ]
+        verbose_name = "Похожее произведение"
+        verbose_name_plural = "Похожие произведения"
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.db.models import Avg, Count, Sum
+
+from .models import Review, Title
+
+RECOMPUTE_BATCH_SIZE = 1000
+
+
+def weighted_rating(scores_sum, scores_count):
+    mean = settings.TITLE_RATING_PRIOR_MEAN
+    weight = settings.TITLE_RATING_PRIOR_WEIGHT
+    return (mean * weight + (scores_sum or 0)) / (weight + scores_count)
+
+
+def rating_fields(stats):
+    return {
+        "rating": stats["rating"] or 0,
+        "reviews_count": stats["reviews_count"],
+        "weighted_rating": weighted_rating(
+            stats["scores_sum"], stats["scores_count"]
+        ),
+    }
+
+
+def update_title_rating(title_id):
+    stats = Review.objects.filter(title_id=title_id).aggregate(
+        rating=Avg("score"),
+        reviews_count=Count("pk"),
+        scores_sum=Sum("score"),
+        scores_count=Count("score"),
+    )
+    Title.objects.filter(pk=title_id).update(**rating_fields(stats))
+
+
+def recompute_ratings(batch_size=RECOMPUTE_BATCH_SIZE):
+    titles = Title.objects.order_by().annotate(
+        score_avg=Avg("reviews__score"),
+        score_reviews=Count("reviews"),
+        scores_sum=Sum("reviews__score"),
+        scores_count=Count("reviews__score"),
+    )
+    batch = []
+    updated = 0
+    for title in titles.iterator(chunk_size=batch_size):
+        fields = rating_fields(
+            {
+                "rating": title.score_avg,
+                "reviews_count": title.score_reviews,
+                "scores_sum": title.scores_sum,
+                "scores_count": title.scores_count,
+            }
+        )
+        for name, value in fields.items():
+            setattr(title, name, value)
+        batch.append(title)
+        if len(batch) >= batch_size:
+            updated += flush_ratings(batch)
+    return updated + flush_ratings(batch)
+
+
+def flush_ratings(titles):
+    Title.objects.bulk_update(
+        titles, ("rating", "reviews_count", "weighted_rating")
+    )
+    count = len(titles)
+    titles.clear()
+    return count
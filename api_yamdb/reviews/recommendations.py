@@ -0,0 +1,69 @@
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Review, SimilarTitle
+from .similarity import SIMILAR_TITLES_VERSION
+from .versions import get_version
+
+RECOMMENDATIONS_KEY = "recommendations:{}"
+
+
+def score_titles(seen_ids, scores, neighbours):
+    if not len(neighbours):
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    order = np.argsort(seen_ids)
+    positions = np.searchsorted(seen_ids, neighbours[:, 0], sorter=order)
+    rated = scores[order[positions]]
+    similar_ids, columns = np.unique(
+        neighbours[:, 1].astype(np.int64), return_inverse=True
+    )
+    weights = neighbours[:, 2]
+    support = np.bincount(columns, weights=weights)
+    predicted = np.bincount(columns, weights=weights * rated) / support
+    unseen = ~np.isin(similar_ids, seen_ids)
+    similar_ids = similar_ids[unseen]
+    predicted, support = predicted[unseen], support[unseen]
+    order = np.lexsort((similar_ids, -support, -predicted))
+    return similar_ids[order], predicted[order]
+
+
+def compute_recommendations(user_id, limit):
+    reviews = np.array(
+        Review.objects.filter(author_id=user_id, score__isnull=False)
+        .order_by()
+        .values_list("title_id", "score"),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    neighbours = np.array(
+        SimilarTitle.objects.filter(title_id__in=reviews[:, 0].tolist())
+        .order_by()
+        .values_list("title_id", "similar_id", "score"),
+        dtype=np.float64,
+    ).reshape(-1, 3)
+    title_ids, predicted = score_titles(
+        reviews[:, 0], reviews[:, 1], neighbours
+    )
+    return [
+        {"title_id": title_id, "predicted_rating": rating}
+        for title_id, rating in zip(
+            title_ids[:limit].tolist(), predicted[:limit].tolist()
+        )
+    ]
+
+
+def get_recommendations(user_id):
+    key = RECOMMENDATIONS_KEY.format(user_id)
+    version = get_version(SIMILAR_TITLES_VERSION)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    recommendations = compute_recommendations(
+        user_id, settings.TOP_TITLES_LIMIT
+    )
+    cache.set(key, (version, recommendations), None)
+    return recommendations
+
+
+def forget_recommendations(user_id):
+    cache.delete(RECOMMENDATIONS_KEY.format(user_id))
@@ -0,0 +1,124 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .analytics import ANALYTICS_VERSION
+from .bitmaps import title_index
+from .counters import count_comment, count_review
+from .models import Category, Comment, Genre, Review, Title
+from .ratings import update_title_rating
+from .recommendations import forget_recommendations
+from .trending import record_review
+from .versions import bump_version, model_version_name, on_commit_once
+
+
+@receiver(post_save, sender=Title)
+def index_title(sender, instance, **kwargs):
+    transaction.on_commit(
+        lambda: title_index.update_title(
+            instance.pk, instance.category_id, instance.year
+        )
+    )
+
+
+@receiver(post_delete, sender=Title)
+def unindex_title(sender, instance, **kwargs):
+    title_pk = instance.pk
+    transaction.on_commit(lambda: title_index.delete_title(title_pk))
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def index_title_genres(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        title_ids, genre_ids = pk_set, {instance.pk}
+    else:
+        title_ids, genre_ids = {instance.pk}, pk_set
+
+    def update():
+        if action == "post_add":
+            title_index.add_genres(title_ids, genre_ids)
+        elif action == "post_remove":
+            title_index.remove_genres(title_ids, genre_ids)
+        elif reverse:
+            title_index.delete_key("genres", instance.pk)
+        else:
+            title_index.remove_genres(title_ids)
+
+    transaction.on_commit(update)
+
+
+@receiver(post_delete, sender=Genre)
+def unindex_genre(sender, instance, **kwargs):
+    genre_pk = instance.pk
+    transaction.on_commit(lambda: title_index.delete_key("genres", genre_pk))
+
+
+@receiver(post_delete, sender=Category)
+def unindex_category(sender, instance, **kwargs):
+    category_pk = instance.pk
+    transaction.on_commit(
+        lambda: title_index.delete_key("categories", category_pk)
+    )
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def expire_model_version(sender, **kwargs):
+    on_commit_once(bump_version, model_version_name(sender))
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def rate_title(sender, instance, **kwargs):
+    on_commit_once(update_title_rating, instance.title_id)
+
+
+@receiver(post_save, sender=Review)
+def track_title_activity(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: record_review(instance))
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def expire_recommendations(sender, instance, **kwargs):
+    on_commit_once(forget_recommendations, instance.author_id)
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(m2m_changed, sender=Title.genre.through)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def expire_analytics(sender, **kwargs):
+    on_commit_once(bump_version, ANALYTICS_VERSION)
+
+
+@receiver(post_save, sender=Review)
+def count_created_review(sender, instance, created, **kwargs):
+    if created:
+        count_review(instance, 1)
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review(sender, instance, **kwargs):
+    count_review(instance, -1)
+
+
+@receiver(post_save, sender=Comment)
+def count_created_comment(sender, instance, created, **kwargs):
+    if created:
+        count_comment(instance, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def count_deleted_comment(sender, instance, **kwargs):
+    count_comment(instance, -1)
@@ -0,0 +1,95 @@
+from itertools import chain
+
+import numpy as np
+from django.db import transaction
+from scipy import sparse
+
+from .models import Review, SimilarTitle
+from .versions import bump_version
+
+NEIGHBOURS = 20
+BATCH_SIZE = 500
+READ_CHUNK_SIZE = 10000
+SIMILAR_TITLES_VERSION = "similar_titles"
+
+
+def load_review_matrix(chunk_size=READ_CHUNK_SIZE):
+    rows = (
+        Review.objects.filter(score__isnull=False)
+        .order_by()
+        .values_list("title_id", "author_id", "score")
+        .iterator(chunk_size=chunk_size)
+    )
+    reviews = np.fromiter(chain.from_iterable(rows), dtype=np.int64)
+    reviews = reviews.reshape(-1, 3)
+    title_ids, title_rows = np.unique(reviews[:, 0], return_inverse=True)
+    user_ids, user_columns = np.unique(reviews[:, 1], return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (reviews[:, 2].astype(np.float32), (title_rows, user_columns)),
+        shape=(len(title_ids), len(user_ids)),
+    )
+    return title_ids, matrix
+
+
+def normalize_rows(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms) @ matrix
+
+
+def top_neighbours(similarities, row, column, neighbours):
+    start, end = similarities.indptr[row], similarities.indptr[row + 1]
+    columns = similarities.indices[start:end]
+    scores = similarities.data[start:end]
+    others = (columns != column) & (scores > 0)
+    columns, scores = columns[others], scores[others]
+    if len(scores) > neighbours:
+        best = np.argpartition(-scores, neighbours)[:neighbours]
+        columns, scores = columns[best], scores[best]
+    order = np.argsort(-scores, kind="stable")
+    return columns[order], scores[order]
+
+
+def compute_neighbours(title_ids, matrix, neighbours, batch_size):
+    normalized = normalize_rows(matrix).tocsr()
+    transposed = normalized.T.tocsc()
+    titles, similar, scores = [], [], []
+    for start in range(0, normalized.shape[0], batch_size):
+        block = (normalized[start:start + batch_size] @ transposed).tocsr()
+        for row in range(block.shape[0]):
+            columns, row_scores = top_neighbours(
+                block, row, start + row, neighbours
+            )
+            titles.append(np.full(len(columns), title_ids[start + row]))
+            similar.append(title_ids[columns])
+            scores.append(row_scores)
+    if not titles:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+    return np.concatenate(titles), np.concatenate(similar), np.concatenate(
+        scores
+    )
+
+
+def build_similar_titles(neighbours=NEIGHBOURS, batch_size=BATCH_SIZE):
+    # Соседи считаются вне транзакции: блокировка записи SQLite берётся
+    # только на замену строк, а не на всё умножение матриц.
+    title_ids, matrix = load_review_matrix()
+    titles, similar, scores = compute_neighbours(
+        title_ids, matrix, neighbours, batch_size
+    )
+    with transaction.atomic():
+        SimilarTitle.objects.all().delete()
+        for start in range(0, len(titles), READ_CHUNK_SIZE):
+            end = start + READ_CHUNK_SIZE
+            SimilarTitle.objects.bulk_create(
+                SimilarTitle(
+                    title_id=int(title_id),
+                    similar_id=int(similar_id),
+                    score=float(score),
+                )
+                for title_id, similar_id, score in zip(
+                    titles[start:end], similar[start:end], scores[start:end]
+                )
+            )
+        transaction.on_commit(lambda: bump_version(SIMILAR_TITLES_VERSION))
+    return len(title_ids), len(titles)
@@ -0,0 +1,53 @@
+import threading
+
+from .models import Category, Genre
+from .versions import get_version, model_version_name
+
+
+class SlugMap:
+    """Строки небольшой таблицы по slug, общие для всего процесса.
+
+    Карта перечитывается целиком, когда меняется версия модели в кэше:
+    её повышают сигналы сохранения и удаления объектов.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.version_name = model_version_name(model)
+        self.field_names = [
+            field.attname for field in model._meta.concrete_fields
+        ]
+        self.pk_index = self.field_names.index(model._meta.pk.attname)
+        self.slug_index = self.field_names.index("slug")
+        self.lock = threading.Lock()
+        self.version = None
+        self.rows = {}
+        self.db = None
+
+    def load(self):
+        version = get_version(self.version_name)
+        if version == self.version:
+            return self.rows
+        queryset = self.model.objects.order_by()
+        rows = {
+            row[self.slug_index]: row
+            for row in queryset.values_list(*self.field_names)
+        }
+        with self.lock:
+            self.rows, self.version, self.db = rows, version, queryset.db
+        return rows
+
+    def get(self, slug):
+        row = self.load().get(slug)
+        if row is None:
+            return None
+        return self.model.from_db(self.db, self.field_names, row)
+
+    def ids(self, slugs):
+        rows = self.load()
+        return [rows[slug][self.pk_index] for slug in slugs if slug in rows]
+
+
+category_slugs = SlugMap(Category)
+genre_slugs = SlugMap(Genre)
+slug_maps = {Category: category_slugs, Genre: genre_slugs}
@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Case,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Q,
+    Sum,
+    When,
+)
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from .models import TitleActivity
+
+WINDOWS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(days=7),
+}
+HOURLY_BUCKETS_AGE = timedelta(days=1)
+DAILY_BUCKETS_AGE = timedelta(days=7)
+COMPACTION_KEY = "trending_compaction:{:%Y%m%d%H}"
+
+
+def bucket_start(moment, span):
+    if span == TitleActivity.DAY:
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def add_activity(title_id, span, start, reviews_count):
+    buckets = TitleActivity.objects.filter(
+        title_id=title_id, span=span, start=start
+    )
+    if buckets.update(reviews_count=F("reviews_count") + reviews_count):
+        return
+    try:
+        with transaction.atomic():
+            TitleActivity.objects.create(
+                title_id=title_id,
+                span=span,
+                start=start,
+                reviews_count=reviews_count,
+            )
+    except IntegrityError:
+        buckets.update(reviews_count=F("reviews_count") + reviews_count)
+
+
+def record_review(review):
+    now = timezone.now()
+    start = bucket_start(review.pub_date or now, TitleActivity.HOUR)
+    add_activity(review.title_id, TitleActivity.HOUR, start, 1)
+    if cache.add(COMPACTION_KEY.format(now), True, 2 * TitleActivity.HOUR):
+        compact_activity(now)
+
+
+@transaction.atomic
+def compact_activity(now=None):
+    now = now or timezone.now()
+    hourly_until = bucket_start(now - HOURLY_BUCKETS_AGE, TitleActivity.DAY)
+    hourly = TitleActivity.objects.filter(
+        span=TitleActivity.HOUR, start__lt=hourly_until
+    )
+    days = (
+        hourly.annotate(day=TruncDay("start"))
+        .values("title_id", "day")
+        .annotate(total=Sum("reviews_count"))
+        .order_by()
+    )
+    for day in days:
+        add_activity(day["title_id"], TitleActivity.DAY, day["day"],
+                     day["total"])
+    hourly.delete()
+    daily_until = bucket_start(now - DAILY_BUCKETS_AGE, TitleActivity.DAY)
+    TitleActivity.objects.filter(
+        span=TitleActivity.DAY, start__lt=daily_until
+    ).delete()
+
+
+def partial_bucket(since, span):
+    start = bucket_start(since, span)
+    length = timedelta(seconds=span)
+    return start, (start + length - since) / length
+
+
+# Интервал, начавшийся до начала окна, входит в окно частично: его отзывы
+# учитываются в доле, равной доле интервала внутри окна.
+def trending_titles(window, limit, now=None):
+    since = (now or timezone.now()) - WINDOWS[window]
+    hour_start, hour_share = partial_bucket(since, TitleActivity.HOUR)
+    day_start, day_share = partial_bucket(since, TitleActivity.DAY)
+    buckets = TitleActivity.objects.filter(
+        Q(span=TitleActivity.HOUR, start__gte=hour_start)
+        | Q(span=TitleActivity.DAY, start__gte=day_start)
+    )
+    activity = Case(
+        When(
+            span=TitleActivity.HOUR,
+            start=hour_start,
+            then=ExpressionWrapper(
+                F("reviews_count") * hour_share, output_field=FloatField()
+            ),
+        ),
+        When(
+            span=TitleActivity.DAY,
+            start=day_start,
+            then=ExpressionWrapper(
+                F("reviews_count") * day_share, output_field=FloatField()
+            ),
+        ),
+        default=F("reviews_count"),
+        output_field=FloatField(),
+    )
+    return list(
+        buckets.values("title_id")
+        .annotate(activity=Sum(activity))
+        .order_by("-activity", "title_id")[:limit]
+    )
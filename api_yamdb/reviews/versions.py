@@ -0,0 +1,49 @@
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "version:{}"
+
+
+# Версия начинается с текущего времени: после очистки кэша она не
+# совпадёт с той, по которой процесс строил свои локальные данные.
+def get_version(name):
+    return cache.get_or_set(VERSION_KEY.format(name), time.time_ns, None)
+
+
+def bump_version(name):
+    key = VERSION_KEY.format(name)
+    cache.add(key, time.time_ns(), None)
+    return cache.incr(key)
+
+
+def model_version_name(model):
+    return f"model:{model._meta.label_lower}"
+
+
+class PendingCalls:
+    def __init__(self):
+        self.calls = {}
+
+    def __call__(self):
+        calls, self.calls = self.calls, {}
+        for func, args in calls:
+            func(*args)
+
+
+# Как transaction.on_commit, но одинаковый вызов выполняется один раз за
+# транзакцию: каскадное удаление не сбрасывает кэш на каждую строку.
+def on_commit_once(func, *args, using=None):
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        transaction.on_commit(partial(func, *args), using)
+        return
+    for entry in connection.run_on_commit:
+        if isinstance(entry[1], PendingCalls):
+            entry[1].calls[(func, args)] = None
+            return
+    pending = PendingCalls()
+    pending.calls[(func, args)] = None
+    transaction.on_commit(pending, using)
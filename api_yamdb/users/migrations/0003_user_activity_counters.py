@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-19 19:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_confirmation_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество комментариев'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество отзывов'),
+        ),
+    ]
@@ -46,6 +46,12 @@ class User(AbstractUser):
         verbose_name="Код подтверждения",
         max_length=100, blank=True, null=True
     )
+    reviews_count = models.PositiveIntegerField(
+        verbose_name="Количество отзывов", default=0
+    )
+    comments_count = models.PositiveIntegerField(
+        verbose_name="Количество комментариев", default=0
+    )
 
     class Meta:
         verbose_name = "пользователь"
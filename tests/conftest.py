@@ -1,5 +1,8 @@
 import os
+import shutil
 import sys
+import tempfile
+from functools import partial
 
 from django.utils.version import get_version
 
@@ -32,4 +35,17 @@ assert get_version() < '4.0.0', 'Пожалуйста, используйте в
 
 pytest_plugins = [
     'tests.fixtures.fixture_user',
+    'tests.fixtures.fixture_titles',
 ]
+
+
+def pytest_configure(config):
+    # Кэш хранится в файлах: тесты пишут во временный каталог, а не в кэш
+    # сервера разработки. Каталог задаётся до сбора тестов: модули с
+    # `cache` на уровне модуля создают бэкенд уже при сборе.
+    from django.conf import settings
+
+    location = tempfile.mkdtemp(prefix='api_yamdb-cache-')
+    config.add_cleanup(partial(shutil.rmtree, location, ignore_errors=True))
+    for alias, cache in settings.CACHES.items():
+        cache['LOCATION'] = os.path.join(location, alias)
@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.fixture
+def rated_titles(django_user_model):
+    from reviews.models import Review, Title
+
+    users = [
+        django_user_model.objects.create_user(
+            username=f'critic{idx}', email=f'critic{idx}@yamdb.fake'
+        )
+        for idx in range(4)
+    ]
+    titles = [
+        Title.objects.create(name=name, year=2000)
+        for name in ('A', 'B', 'C', 'D')
+    ]
+    scores = {
+        (0, 0): 10, (0, 1): 9, (0, 2): 8,
+        (1, 0): 9, (1, 1): 10, (1, 2): 8,
+        (2, 0): 1, (2, 3): 7,
+    }
+    for (title, user), score in scores.items():
+        Review.objects.create(
+            title=titles[title], author=users[user], text='...', score=score
+        )
+    return titles
@@ -0,0 +1,81 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments
+
+
+def explain_endpoint(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK, (
+        f'Проверьте, что GET-запрос к `{url}` возвращает ответ со статусом '
+        '200.'
+    )
+    plans = []
+    with connection.cursor() as cursor:
+        for query in context.captured_queries:
+            if not query['sql'].startswith('SELECT'):
+                continue
+            cursor.execute('EXPLAIN QUERY PLAN ' + query['sql'])
+            plans.append(
+                (query['sql'], [row[-1] for row in cursor.fetchall()])
+            )
+    return plans
+
+
+def check_query_plans(client, url):
+    for sql, plan in explain_endpoint(client, url):
+        for step in plan:
+            assert 'TEMP B-TREE' not in step, (
+                f'Запрос эндпоинта `{url}` сортируется во временном B-tree '
+                f'вместо индекса: {step}\n{sql}'
+            )
+            assert not (step.startswith('SCAN') and 'INDEX' not in step), (
+                f'Запрос эндпоинта `{url}` выполняет полный просмотр '
+                f'таблицы: {step}\n{sql}'
+            )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08QueryPlans:
+
+    def test_01_list_endpoints_use_indexes(self, client, admin_client,
+                                           user_client, user,
+                                           moderator_client, moderator):
+        author_map = {user: user_client, moderator: moderator_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        title_id = titles[0]['id']
+        urls = (
+            '/api/v1/categories/',
+            '/api/v1/genres/',
+            '/api/v1/titles/',
+            f'/api/v1/titles/?year={titles[0]["year"]}',
+            '/api/v1/titles/?category=films',
+            '/api/v1/titles/?genre=horror,comedy',
+            '/api/v1/titles/?genre=horror,comedy&genre_match=all',
+            '/api/v1/titles/?ordering=-rating',
+            '/api/v1/titles/?ordering=-reviews_count',
+            '/api/v1/titles/?ordering=year',
+            '/api/v1/titles/?pagination=cursor&ordering=-rating',
+            '/api/v1/titles/?rating_min=5&ordering=-rating',
+            '/api/v1/titles/?rating_max=5&ordering=-rating',
+            '/api/v1/titles/?reviews_min=1&ordering=-reviews_count',
+            '/api/v1/titles/top/',
+            '/api/v1/titles/top/?category=films',
+            '/api/v1/titles/top/?genre=horror',
+            '/api/v1/reviews/latest/',
+            '/api/v1/reviews/latest/?category=films',
+            '/api/v1/reviews/latest/?genre=horror',
+            f'/api/v1/titles/{title_id}/',
+            f'/api/v1/titles/{title_id}/?expand=reviews.comments',
+            f'/api/v1/titles/{title_id}/reviews/',
+            f'/api/v1/titles/{title_id}/reviews/{reviews[0]["id"]}/'
+            'comments/',
+        )
+        for url in urls:
+            check_query_plans(client, url)
+        for url in ('/api/v1/users/me/reviews/', '/api/v1/users/me/comments/'):
+            check_query_plans(user_client, url)
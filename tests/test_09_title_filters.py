@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleFilters:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def get_names(self, client, query):
+        response = client.get(f'{self.TITLES_URL}?{query}')
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}?{query}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        names = [title['name'] for title in data['results']]
+        assert data['count'] == len(names), (
+            f'Проверьте, что для `{self.TITLES_URL}?{query}` ключ `count` '
+            'совпадает с количеством найденных произведений.'
+        )
+        return names
+
+    def test_01_genre_exact_match(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        assert self.get_names(client, 'genre=horror') == [titles[0]['name']]
+        assert self.get_names(client, 'genre=hor') == [], (
+            'Проверьте, что фильтр `genre` сравнивает slug жанра целиком.'
+        )
+        assert self.get_names(client, 'category=film') == [], (
+            'Проверьте, что фильтр `category` сравнивает slug категории '
+            'целиком.'
+        )
+
+    def test_02_genre_any_without_duplicates(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        names = self.get_names(client, 'genre=horror,comedy,drama')
+        assert sorted(names) == sorted(title['name'] for title in titles), (
+            'Проверьте, что фильтр `genre` со списком slug возвращает '
+            'произведения с любым из жанров без повторов.'
+        )
+        names = self.get_names(client, 'category=films,books')
+        assert len(names) == len(titles)
+
+    def test_03_genre_all(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        names = self.get_names(client, 'genre=horror,comedy&genre_match=all')
+        assert names == [titles[0]['name']], (
+            'Проверьте, что при `genre_match=all` возвращаются только '
+            'произведения, у которых есть все перечисленные жанры.'
+        )
+        names = self.get_names(client, 'genre=horror,drama&genre_match=all')
+        assert names == []
+        names = self.get_names(
+            client, 'genre=horror,unknown&genre_match=all'
+        )
+        assert names == []
+
+    def test_04_rating_range(self, client):
+        from reviews.models import Title
+
+        Title.objects.bulk_create([
+            Title(name='Без отзывов', year=2000),
+            Title(name='Средний', year=2000, rating=7.5, reviews_count=2),
+            Title(name='Хороший', year=2000, rating=8, reviews_count=1),
+            Title(name='Отличный', year=2000, rating=9.5, reviews_count=40),
+        ])
+        assert self.get_names(client, 'rating_min=8') == [
+            'Отличный', 'Хороший'
+        ], (
+            'Проверьте, что фильтр `rating_min` возвращает произведения с '
+            'рейтингом не ниже указанного.'
+        )
+        assert self.get_names(client, 'rating_max=7') == ['Средний'], (
+            'Проверьте, что фильтр `rating_max` учитывает рейтинг, '
+            'округлённый вниз, и пропускает произведения без отзывов.'
+        )
+        assert self.get_names(client, 'rating_min=7&rating_max=8') == [
+            'Средний', 'Хороший'
+        ]
+        for query in ('rating_max=7.5', 'rating_min=7.5'):
+            response = client.get(f'{self.TITLES_URL}?{query}')
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                'Проверьте, что границы рейтинга принимают только целые '
+                'числа, как рейтинг в ответе.'
+            )
+        assert self.get_names(client, 'reviews_min=2') == [
+            'Отличный', 'Средний'
+        ], (
+            'Проверьте, что фильтр `reviews_min` возвращает произведения с '
+            'количеством отзывов не меньше указанного.'
+        )
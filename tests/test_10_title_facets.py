@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10TitleFacets:
+
+    FACETS_URL = '/api/v1/titles/facets/'
+
+    def test_01_facets(self, client, admin_client, django_assert_num_queries):
+        create_titles(admin_client)
+        with django_assert_num_queries(3):
+            response = client.get(self.FACETS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.FACETS_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        data = response.json()
+        genres = {genre['slug']: genre['count'] for genre in data['genre']}
+        assert genres == {'horror': 1, 'comedy': 1, 'drama': 1}, (
+            f'Проверьте, что `{self.FACETS_URL}` считает произведения по '
+            'жанрам.'
+        )
+        categories = {
+            category['slug']: category['count']
+            for category in data['category']
+        }
+        assert categories == {'films': 1, 'books': 1}, (
+            f'Проверьте, что `{self.FACETS_URL}` считает произведения по '
+            'категориям.'
+        )
+        assert data['year'] == [{'from': 1980, 'to': 1989, 'count': 2}], (
+            f'Проверьте, что `{self.FACETS_URL}` считает произведения по '
+            'десятилетиям.'
+        )
+        assert all(
+            type(value) is int for year in data['year'] for value in year.values()
+        ), (
+            f'Проверьте, что `{self.FACETS_URL}` возвращает годы целыми '
+            'числами.'
+        )
+
+    def test_02_facets_follow_filters(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get(
+            f'{self.FACETS_URL}?genre=horror&year_bucket=1'
+        )
+        data = response.json()
+        assert {genre['slug'] for genre in data['genre']} == {
+            'horror', 'comedy'
+        }, (
+            f'Проверьте, что `{self.FACETS_URL}` учитывает фильтры '
+            '`/api/v1/titles/`.'
+        )
+        assert data['category'] == [
+            {'slug': 'films', 'name': 'Фильм', 'count': 1}
+        ]
+        assert data['year'] == [{'from': 1984, 'to': 1984, 'count': 1}]
+
+        response = client.get(f'{self.FACETS_URL}?year_bucket=0')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
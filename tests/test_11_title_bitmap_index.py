@@ -0,0 +1,137 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from tests.utils import create_titles
+
+
+@pytest.fixture
+def bitmap_index(settings):
+    from reviews.bitmaps import title_index
+
+    cache.clear()
+    title_index.version = None
+    settings.TITLE_BITMAP_INDEX = True
+    return title_index
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11TitleBitmapIndex:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    QUERIES = (
+        'genre=horror',
+        'genre=horror,drama',
+        'genre=horror,comedy&genre_match=all',
+        'genre=horror,drama&genre_match=all',
+        'genre=horror,unknown&genre_match=all',
+        'category=books',
+        'category=films&genre=comedy',
+        'year=1988',
+        'year=1988&category=films',
+        'name=Терм&genre=horror',
+    )
+
+    def get_names(self, client, query):
+        response = client.get(f'{self.TITLES_URL}?{query}')
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        return data['count'], sorted(
+            title['name'] for title in data['results']
+        )
+
+    def check_same_results(self, client, settings):
+        for query in self.QUERIES:
+            settings.TITLE_BITMAP_INDEX = True
+            indexed = self.get_names(client, query)
+            settings.TITLE_BITMAP_INDEX = False
+            expected = self.get_names(client, query)
+            settings.TITLE_BITMAP_INDEX = True
+            assert indexed == expected, (
+                f'Проверьте, что фильтр `{self.TITLES_URL}?{query}` через '
+                'битовый индекс возвращает те же произведения, что и SQL.'
+            )
+
+    def test_01_index_matches_sql(self, client, admin_client, bitmap_index,
+                                  settings):
+        create_titles(admin_client)
+        self.check_same_results(client, settings)
+
+    def test_02_index_follows_writes(self, client, admin_client,
+                                     bitmap_index, settings):
+        titles, _, _ = create_titles(admin_client)
+        self.check_same_results(client, settings)
+
+        response = admin_client.patch(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            data={'category': 'books', 'genre': ['drama'], 'year': 1988}
+        )
+        assert response.status_code == HTTPStatus.OK
+        self.check_same_results(client, settings)
+
+        admin_client.delete('/api/v1/genres/drama/')
+        admin_client.delete(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        )
+        self.check_same_results(client, settings)
+
+    def test_03_rebuild_command(self, client, admin_client, bitmap_index,
+                                settings):
+        titles, _, _ = create_titles(admin_client)
+        bitmap_index.select()
+        version = bitmap_index.version
+        call_command('rebuild_title_index')
+        assert bitmap_index.version > version, (
+            'Проверьте, что команда `rebuild_title_index` меняет версию '
+            'индекса, чтобы его перестроили все процессы.'
+        )
+        assert bitmap_index.titles.bit_count() == len(titles)
+        self.check_same_results(client, settings)
+
+    def test_04_large_selection(self, client, bitmap_index,
+                                django_assert_num_queries):
+        import sqlite3
+
+        from django.db import connection
+
+        from reviews.models import Category, Title
+
+        books = Category.objects.create(name='Книга', slug='books')
+        Title.objects.bulk_create(
+            Title(name=f'Книга {number:04}', year=2000, category=books)
+            for number in range(300)
+        )
+        Title.objects.create(name='Без категории', year=2000)
+        connection.ensure_connection()
+        # Лимит переменных SQLite снижен, чтобы не создавать сотни тысяч
+        # произведений.
+        limit = connection.connection.setlimit(
+            sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 100
+        )
+        try:
+            client.get(f'{self.TITLES_URL}?category=books')
+            with django_assert_num_queries(2):
+                response = client.get(f'{self.TITLES_URL}?category=books')
+            assert response.status_code == HTTPStatus.OK, (
+                'Проверьте, что фильтр через битовый индекс не передаёт '
+                'в SQL по переменной на каждое произведение.'
+            )
+            data = response.json()
+            assert data['count'] == 300
+            assert [title['name'] for title in data['results']] == [
+                f'Книга {number:04}' for number in range(10)
+            ]
+            response = client.get(
+                f'{self.TITLES_URL}facets/?category=books'
+            )
+            assert response.status_code == HTTPStatus.OK
+            assert response.json()['year'] == [
+                {'from': 2000, 'to': 2009, 'count': 300}
+            ]
+        finally:
+            connection.connection.setlimit(
+                sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit
+            )
@@ -0,0 +1,162 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12TitleOrdering:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_stored_rating(self, client, admin_client, user_client,
+                              moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'ok', 4)
+        create_single_review(moderator_client, titles[0]['id'], 'good', 7)
+        create_single_review(user_client, titles[1]['id'], 'great', 9)
+
+        response = client.get(f'{self.TITLES_URL}?ordering=-rating')
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert [title['id'] for title in results] == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            f'Проверьте, что `{self.TITLES_URL}?ordering=-rating` сортирует '
+            'произведения по убыванию рейтинга.'
+        )
+        assert [title['rating'] for title in results] == [9, 5], (
+            'Проверьте, что рейтинг произведения пересчитывается после '
+            'добавления отзыва.'
+        )
+
+        response = client.get(f'{self.TITLES_URL}?ordering=-reviews_count')
+        results = response.json()['results']
+        assert results[0]['id'] == titles[0]['id'], (
+            f'Проверьте, что `{self.TITLES_URL}?ordering=-reviews_count` '
+            'сортирует произведения по убыванию количества отзывов.'
+        )
+
+        review_id = client.get(
+            f'{self.TITLES_URL}{titles[1]["id"]}/reviews/'
+        ).json()['results'][0]['id']
+        admin_client.delete(
+            f'{self.TITLES_URL}{titles[1]["id"]}/reviews/{review_id}/'
+        )
+        response = client.get(f'{self.TITLES_URL}{titles[1]["id"]}/')
+        assert response.json()['rating'] is None, (
+            'Проверьте, что после удаления всех отзывов рейтинг '
+            'произведения равен `None`.'
+        )
+
+    def test_02_cursor_pagination(self, client):
+        from reviews.models import Title
+
+        Title.objects.bulk_create(
+            Title(
+                name=f'Произведение {idx}',
+                year=1950 + idx,
+                rating=idx % 7 + 1,
+                reviews_count=idx,
+            )
+            for idx in range(25)
+        )
+        expected = list(
+            Title.objects.order_by('-rating', 'name')
+            .values_list('rating', flat=True)
+        )
+
+        url = f'{self.TITLES_URL}?pagination=cursor&ordering=-rating'
+        ratings = []
+        ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что `pagination=cursor` включает курсорную '
+                'пагинацию.'
+            )
+            ratings.extend(title['rating'] for title in data['results'])
+            ids.extend(title['id'] for title in data['results'])
+            url = data['next']
+        assert len(ids) == len(set(ids)) == len(expected), (
+            'Проверьте, что курсорная пагинация возвращает каждое '
+            'произведение ровно один раз.'
+        )
+        assert ratings == [int(rating) for rating in expected], (
+            'Проверьте, что курсорная пагинация учитывает параметр '
+            '`ordering`.'
+        )
+
+    def test_03_cursor_over_ties(self, client, monkeypatch):
+        from api.pagination import TitleCursorPagination
+        from reviews.models import Title
+
+        # Смещение среди равных значений в курсоре DRF ограничено
+        # offset_cutoff; курсор по (rating, id) от него не зависит.
+        monkeypatch.setattr(TitleCursorPagination, 'offset_cutoff', 5)
+        Title.objects.bulk_create(
+            Title(name=f'Без оценок {idx:02}', year=2000) for idx in range(35)
+        )
+        expected = list(
+            Title.objects.order_by('-reviews_count', '-id')
+            .values_list('id', flat=True)
+        )
+        url = f'{self.TITLES_URL}?pagination=cursor&ordering=-reviews_count'
+        pages = []
+        while url:
+            data = client.get(url).json()
+            pages.append([title['id'] for title in data['results']])
+            url = data['next']
+        assert sum(pages, []) == expected, (
+            'Проверьте, что курсорная пагинация проходит все произведения '
+            'с одинаковым значением сортировки ровно по одному разу.'
+        )
+
+        previous = data['previous']
+        assert previous is not None
+        data = client.get(previous).json()
+        assert [title['id'] for title in data['results']] == pages[-2], (
+            'Проверьте, что ссылка `previous` возвращает предыдущую '
+            'страницу.'
+        )
+        response = client.get(f'{self.TITLES_URL}?pagination=cursor&cursor=x')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_04_page_numbers_over_ties(self, client):
+        from reviews.models import Title
+
+        Title.objects.bulk_create(
+            Title(name='Одно название', year=2000) for _ in range(15)
+        )
+        ids = []
+        for page in (1, 2):
+            response = client.get(
+                f'{self.TITLES_URL}?ordering=rating&page={page}'
+            )
+            ids.extend(title['id'] for title in response.json()['results'])
+        assert ids == sorted(ids) and len(set(ids)) == 15, (
+            'Проверьте, что при равных значениях сортировки произведения '
+            'упорядочены по id и не повторяются на разных страницах.'
+        )
+
+    def test_05_cascade_rates_once(self, admin_client, user_client,
+                                   moderator_client, monkeypatch):
+        from reviews import signals
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'отлично', 9)
+        create_single_review(moderator_client, title_id, 'хорошо', 7)
+        create_single_review(admin_client, title_id, 'плохо', 4)
+
+        calls = []
+        monkeypatch.setattr(signals, 'update_title_rating', calls.append)
+        response = admin_client.delete(f'{self.TITLES_URL}{title_id}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert calls == [title_id], (
+            'Проверьте, что при каскадном удалении отзывов рейтинг '
+            'произведения пересчитывается один раз за транзакцию.'
+        )
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13TitleTop:
+
+    TOP_URL = '/api/v1/titles/top/'
+
+    def create_rated_titles(self, admin_client, clients):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(clients[0], titles[0]['id'], 'шедевр', 10)
+        for client in clients:
+            create_single_review(client, titles[1]['id'], 'отлично', 9)
+        return titles
+
+    def test_01_top_prefers_many_reviews(self, client, admin_client,
+                                         user_client, moderator_client,
+                                         user_superuser_client):
+        titles = self.create_rated_titles(
+            admin_client,
+            [user_client, moderator_client, user_superuser_client]
+        )
+        response = client.get(self.TOP_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TOP_URL}` возвращает ответ '
+            'со статусом 200.'
+        )
+        data = response.json()
+        assert [title['id'] for title in data] == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            f'Проверьте, что `{self.TOP_URL}` ранжирует произведения по '
+            'взвешенному рейтингу: одна оценка 10 не должна обгонять '
+            'несколько оценок 9.'
+        )
+        assert data[0]['weighted_rating'] == pytest.approx(
+            (5.5 * 10 + 27) / 13
+        )
+
+        response = client.get(f'{self.TOP_URL}?genre=horror')
+        assert [title['id'] for title in response.json()] == [
+            titles[0]['id']
+        ], f'Проверьте, что `{self.TOP_URL}` фильтрует по жанру.'
+        response = client.get(f'{self.TOP_URL}?category=books&limit=1')
+        assert [title['id'] for title in response.json()] == [
+            titles[1]['id']
+        ], f'Проверьте, что `{self.TOP_URL}` фильтрует по категории.'
+        response = client.get(f'{self.TOP_URL}?limit=0')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_02_recompute_command(self, client, admin_client, user_client,
+                                  moderator_client, settings):
+        from reviews.models import Title
+
+        titles = self.create_rated_titles(
+            admin_client, [user_client, moderator_client]
+        )
+        settings.TITLE_RATING_PRIOR_WEIGHT = 0
+        Title.objects.update(rating=0, reviews_count=0)
+        call_command('recompute_ratings', batch_size=1)
+
+        response = client.get(self.TOP_URL)
+        data = response.json()
+        assert [title['id'] for title in data] == [
+            titles[0]['id'], titles[1]['id']
+        ], (
+            'Проверьте, что команда `recompute_ratings` пересчитывает '
+            'рейтинги всех произведений.'
+        )
+        assert [title['rating'] for title in data] == [10, 9]
+        assert data[1]['weighted_rating'] == pytest.approx(9)
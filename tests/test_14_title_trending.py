@@ -0,0 +1,113 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14TitleTrending:
+
+    TRENDING_URL = '/api/v1/titles/trending/'
+
+    def test_01_trending_counts_new_reviews(self, client, admin_client,
+                                            user_client, moderator_client):
+        cache.clear()
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[1]['id'], 'отлично', 9)
+        create_single_review(moderator_client, titles[1]['id'], 'хорошо', 8)
+        create_single_review(user_client, titles[0]['id'], 'так себе', 4)
+
+        response = client.get(f'{self.TRENDING_URL}?window=hour')
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TRENDING_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [(title['id'], title['activity']) for title in data] == [
+            (titles[1]['id'], 2), (titles[0]['id'], 1)
+        ], (
+            f'Проверьте, что `{self.TRENDING_URL}` упорядочивает '
+            'произведения по количеству новых отзывов.'
+        )
+        assert data[0]['name'] == titles[1]['name']
+
+        response = client.get(f'{self.TRENDING_URL}?window=year')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_02_compaction(self, client):
+        from reviews.models import Title, TitleActivity
+        from reviews.trending import bucket_start, compact_activity
+
+        title = Title.objects.create(name='Старое', year=2000)
+        now = timezone.now()
+        hour = bucket_start(now, TitleActivity.HOUR)
+        starts = [
+            hour,
+            hour - timedelta(hours=3),
+            hour - timedelta(days=2),
+            hour - timedelta(days=2, hours=1),
+            hour - timedelta(days=30),
+        ]
+        TitleActivity.objects.bulk_create(
+            TitleActivity(
+                title=title, span=TitleActivity.HOUR, start=start,
+                reviews_count=1
+            )
+            for start in starts
+        )
+        compact_activity(now)
+
+        buckets = TitleActivity.objects.order_by('start')
+        assert [
+            (bucket.span, bucket.reviews_count) for bucket in buckets
+        ] in (
+            [(TitleActivity.DAY, 2)] + [(TitleActivity.HOUR, 1)] * 2,
+            [(TitleActivity.DAY, 1)] * 2 + [(TitleActivity.HOUR, 1)] * 2,
+        ), (
+            'Проверьте, что старые часовые интервалы объединяются в '
+            'дневные, а интервалы старше недели удаляются.'
+        )
+
+        counts = {}
+        for window in ('hour', 'day', 'week'):
+            data = client.get(f'{self.TRENDING_URL}?window={window}').json()
+            counts[window] = data[0]['activity']
+        assert counts == {'hour': 1, 'day': 2, 'week': 4}, (
+            f'Проверьте, что `{self.TRENDING_URL}` суммирует интервалы, '
+            'попадающие в окно `window`.'
+        )
+
+    def test_03_partial_bucket(self):
+        from reviews.models import Title, TitleActivity
+        from reviews.trending import bucket_start, trending_titles
+
+        title = Title.objects.create(name='На границе', year=2000)
+        hour = bucket_start(timezone.now(), TitleActivity.HOUR)
+        TitleActivity.objects.bulk_create([
+            TitleActivity(
+                title=title, span=TitleActivity.HOUR,
+                start=hour - timedelta(hours=2), reviews_count=8
+            ),
+            TitleActivity(
+                title=title, span=TitleActivity.HOUR,
+                start=hour - timedelta(hours=1), reviews_count=4
+            ),
+            TitleActivity(
+                title=title, span=TitleActivity.HOUR, start=hour,
+                reviews_count=1
+            ),
+        ])
+        now = hour + timedelta(minutes=15)
+        assert trending_titles('hour', 10, now) == [
+            {'title_id': title.id, 'activity': pytest.approx(4)}
+        ], (
+            'Проверьте, что интервал, начавшийся до начала окна, '
+            'учитывается в доле, пересекающейся с окном.'
+        )
+        assert trending_titles('hour', 10, hour)[0]['activity'] == (
+            pytest.approx(5)
+        ), 'Проверьте окно, которое начинается ровно с начала интервала.'
@@ -0,0 +1,66 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15SimilarTitles:
+
+    SIMILAR_URL_TEMPLATE = '/api/v1/titles/{title_id}/similar/'
+
+    def test_01_similar_titles(self, client, rated_titles,
+                               django_assert_num_queries):
+        call_command('build_similar_titles', batch_size=2)
+        url = self.SIMILAR_URL_TEMPLATE.format(title_id=rated_titles[0].id)
+        with django_assert_num_queries(2):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.SIMILAR_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [title['name'] for title in data] == ['B', 'C'], (
+            f'Проверьте, что `{self.SIMILAR_URL_TEMPLATE}` упорядочивает '
+            'произведения по убыванию сходства оценок.'
+        )
+        assert data[0]['similarity'] == pytest.approx(244 / 245)
+        assert 0 < data[1]['similarity'] < data[0]['similarity']
+
+        url = self.SIMILAR_URL_TEMPLATE.format(title_id=rated_titles[3].id)
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == []
+
+        url = self.SIMILAR_URL_TEMPLATE.format(title_id=rated_titles[3].id + 1)
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_02_neighbours_limit(self, client, rated_titles):
+        call_command('build_similar_titles', neighbours=1)
+        url = self.SIMILAR_URL_TEMPLATE.format(title_id=rated_titles[0].id)
+        assert [title['name'] for title in client.get(url).json()] == ['B']
+
+    def test_03_computed_outside_transaction(self, rated_titles,
+                                             monkeypatch):
+        from django.db import connection
+
+        from reviews import similarity
+
+        compute = similarity.compute_neighbours
+
+        def check_compute(*args, **kwargs):
+            assert not connection.in_atomic_block, (
+                'Проверьте, что соседи считаются вне транзакции и не '
+                'держат блокировку записи базы.'
+            )
+            return compute(*args, **kwargs)
+
+        monkeypatch.setattr(similarity, 'compute_neighbours', check_compute)
+        titles, stored = similarity.build_similar_titles()
+        assert (titles, stored) == (3, 6)
+
+    def test_04_no_reviews(self):
+        from reviews.similarity import build_similar_titles
+
+        assert build_similar_titles() == (0, 0)
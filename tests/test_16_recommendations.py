@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from tests.utils import create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16Recommendations:
+
+    RECOMMENDATIONS_URL = '/api/v1/users/me/recommendations/'
+
+    def test_01_not_auth(self, client):
+        response = client.get(self.RECOMMENDATIONS_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            f'Проверьте, что GET-запрос неавторизованного пользователя к '
+            f'`{self.RECOMMENDATIONS_URL}` возвращает ответ со статусом 401.'
+        )
+
+    def test_02_recommendations(self, user_client, rated_titles):
+        cache.clear()
+        create_single_review(user_client, rated_titles[0].id, 'шедевр', 10)
+        call_command('build_similar_titles')
+
+        response = user_client.get(self.RECOMMENDATIONS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.RECOMMENDATIONS_URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [title['name'] for title in data] == ['B', 'C'], (
+            f'Проверьте, что `{self.RECOMMENDATIONS_URL}` возвращает '
+            'непросмотренные произведения, похожие на оценённые '
+            'пользователем.'
+        )
+        assert data[0]['predicted_rating'] == pytest.approx(10)
+
+        create_single_review(user_client, rated_titles[1].id, 'хорошо', 6)
+        data = user_client.get(self.RECOMMENDATIONS_URL).json()
+        assert [title['name'] for title in data] == ['C'], (
+            f'Проверьте, что `{self.RECOMMENDATIONS_URL}` обновляется после '
+            'нового отзыва пользователя.'
+        )
+        assert 6 < data[0]['predicted_rating'] < 10
+
+        response = user_client.get(f'{self.RECOMMENDATIONS_URL}?limit=0')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,90 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17CatalogAnalytics:
+
+    ANALYTICS_URL = '/api/v1/analytics/'
+
+    def test_01_permissions(self, client, user_client):
+        assert client.get(self.ANALYTICS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.ANALYTICS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        ), (
+            f'Проверьте, что `{self.ANALYTICS_URL}` доступен только '
+            'администратору.'
+        )
+
+    def test_02_analytics(self, admin_client, user_client, moderator_client,
+                          capsys):
+        cache.clear()
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'отлично', 9)
+        create_single_review(moderator_client, titles[0]['id'], 'хорошо', 7)
+
+        response = admin_client.get(self.ANALYTICS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос администратора к '
+            f'`{self.ANALYTICS_URL}` возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert data['genre_pairs'] == [
+            {'genres': ['horror', 'comedy'], 'titles': 1}
+        ], 'Проверьте подсчёт пар жанров у произведений.'
+        films = data['ratings_by_category'][0]
+        assert (films['slug'], films['reviews'], films['mean']) == (
+            'films', 2, 8.0
+        )
+        assert films['histogram'] == [0] * 6 + [1, 0, 1, 0]
+        assert data['ratings_by_decade'][0]['decade'] == 1980
+        assert sum(month['reviews'] for month in data['reviews_by_month']) == 2
+
+        create_single_review(admin_client, titles[1]['id'], 'плохо', 4)
+        data = admin_client.get(self.ANALYTICS_URL).json()
+        assert data['reviews'] == 3, (
+            f'Проверьте, что `{self.ANALYTICS_URL}` пересчитывается после '
+            'изменения данных.'
+        )
+        assert data['ratings_by_decade'][0]['mean'] == pytest.approx(
+            6.67, abs=0.01
+        )
+        drama = next(
+            genre for genre in data['ratings_by_genre']
+            if genre['slug'] == 'drama'
+        )
+        assert drama['histogram'][3] == 1
+
+        call_command('catalog_analytics', indent=0)
+        assert '"reviews": 3' in capsys.readouterr().out
+
+    def test_03_cascade_bumps_once(self, admin_client, user_client,
+                                   moderator_client, monkeypatch):
+        from reviews import signals
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'отлично', 9)
+        create_single_review(moderator_client, title_id, 'хорошо', 7)
+        create_single_review(admin_client, title_id, 'плохо', 4)
+
+        calls = []
+        monkeypatch.setattr(signals, 'bump_version', calls.append)
+        monkeypatch.setattr(signals, 'forget_recommendations', calls.append)
+        response = admin_client.delete(f'/api/v1/titles/{title_id}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert calls.count(signals.ANALYTICS_VERSION) == 1, (
+            'Проверьте, что каскадное удаление произведения сбрасывает '
+            'версию аналитики один раз за транзакцию.'
+        )
+        assert len(calls) == len(set(calls)), (
+            'Проверьте, что одинаковые сбросы кэша при каскадном удалении '
+            'выполняются один раз.'
+        )
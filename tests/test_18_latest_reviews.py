@@ -0,0 +1,107 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18LatestReviews:
+
+    LATEST_URL = '/api/v1/reviews/latest/'
+
+    def test_01_latest_reviews(self, client, admin_client, user_client,
+                               moderator_client, django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        reviews = [
+            create_single_review(user_client, titles[0]['id'], 'раз', 5),
+            create_single_review(user_client, titles[1]['id'], 'два', 6),
+            create_single_review(moderator_client, titles[0]['id'], 'три', 7),
+        ]
+        review_ids = [review.json()['id'] for review in reviews]
+
+        with django_assert_num_queries(1):
+            response = client.get(self.LATEST_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.LATEST_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [review['id'] for review in data['results']] == (
+            review_ids[::-1]
+        ), (
+            f'Проверьте, что `{self.LATEST_URL}` возвращает отзывы от '
+            'новых к старым.'
+        )
+        assert data['results'][0]['title'] == {
+            'id': titles[0]['id'], 'name': titles[0]['name']
+        }
+        assert data['results'][0]['author'] == 'TestModerator'
+
+        response = client.get(f'{self.LATEST_URL}?category=books')
+        assert [review['id'] for review in response.json()['results']] == [
+            review_ids[1]
+        ], f'Проверьте, что `{self.LATEST_URL}` фильтрует по категории.'
+        response = client.get(f'{self.LATEST_URL}?genre=horror,comedy')
+        assert [review['id'] for review in response.json()['results']] == [
+            review_ids[2], review_ids[0]
+        ], f'Проверьте, что `{self.LATEST_URL}` фильтрует по жанру.'
+
+    def test_02_cursor(self, client, admin_client, user_client,
+                       monkeypatch):
+        from api.pagination import PubDateCursorPagination
+
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'раз', 5)
+        create_single_review(user_client, titles[1]['id'], 'два', 6)
+        monkeypatch.setattr(PubDateCursorPagination, 'page_size', 1)
+        data = client.get(self.LATEST_URL).json()
+        assert data['previous'] is None
+        assert len(data['results']) == 1
+        next_data = client.get(data['next']).json()
+        assert next_data['results'][0]['title']['id'] == titles[0]['id'], (
+            f'Проверьте, что `{self.LATEST_URL}` использует курсорную '
+            'пагинацию.'
+        )
+
+    def test_03_cursor_microseconds(self, client, admin, monkeypatch):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from api.pagination import PubDateCursorPagination
+        from reviews.models import Review, Title
+
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx}', year=2000) for idx in range(15)
+        )
+        Review.objects.bulk_create(
+            Review(title=title, author=admin, text='текст', score=5)
+            for title in Title.objects.all()
+        )
+        now = timezone.now().replace(microsecond=0)
+        for idx, review in enumerate(Review.objects.order_by('id')):
+            review.pub_date = now + timedelta(microseconds=idx * 7)
+            review.save(update_fields=['pub_date'])
+        expected = list(
+            Review.objects.order_by('-pub_date').values_list('id', flat=True)
+        )
+
+        monkeypatch.setattr(PubDateCursorPagination, 'page_size', 4)
+        pages, url = [], self.LATEST_URL
+        while url:
+            data = client.get(url).json()
+            pages.append(data)
+            url = data['next']
+        ids = [
+            review['id'] for page in pages for review in page['results']
+        ]
+        assert ids == expected, (
+            f'Проверьте, что курсор `{self.LATEST_URL}` не теряет отзывы '
+            'с отметками времени в пределах одной миллисекунды.'
+        )
+        previous = client.get(pages[1]['previous']).json()
+        assert previous['results'] == pages[0]['results'], (
+            'Проверьте, что ссылка `previous` возвращает предыдущую '
+            'страницу.'
+        )
@@ -0,0 +1,59 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19OwnContent:
+
+    MY_REVIEWS_URL = '/api/v1/users/me/reviews/'
+    MY_COMMENTS_URL = '/api/v1/users/me/comments/'
+
+    def test_01_not_auth(self, client):
+        for url in (self.MY_REVIEWS_URL, self.MY_COMMENTS_URL):
+            assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED, (
+                f'Проверьте, что GET-запрос неавторизованного пользователя к '
+                f'`{url}` возвращает ответ со статусом 401.'
+            )
+
+    def test_02_own_reviews_and_comments(self, admin_client, user_client,
+                                         user, moderator_client, moderator,
+                                         django_assert_num_queries):
+        author_map = {user: user_client, moderator: moderator_client}
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        newest = create_single_review(
+            user_client, titles[1]['id'], 'второй', 3
+        ).json()
+
+        with django_assert_num_queries(2):
+            response = user_client.get(self.MY_REVIEWS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.MY_REVIEWS_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [review['id'] for review in data['results']] == [
+            newest['id'], reviews[0]['id']
+        ], (
+            f'Проверьте, что `{self.MY_REVIEWS_URL}` возвращает только '
+            'отзывы пользователя, от новых к старым.'
+        )
+        assert data['results'][0]['title'] == {
+            'id': titles[1]['id'], 'name': titles[1]['name']
+        }
+        assert 'next' in data and 'count' not in data
+
+        with django_assert_num_queries(2):
+            response = moderator_client.get(self.MY_COMMENTS_URL)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()['results']
+        assert [comment['id'] for comment in data] == [comments[1]['id']], (
+            f'Проверьте, что `{self.MY_COMMENTS_URL}` возвращает только '
+            'комментарии пользователя.'
+        )
+        assert data[0]['review'] == {
+            'id': reviews[0]['id'],
+            'title': {'id': titles[0]['id'], 'name': titles[0]['name']},
+        }
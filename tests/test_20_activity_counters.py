@@ -0,0 +1,74 @@
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_comments, create_single_comment
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20ActivityCounters:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    ME_URL = '/api/v1/users/me/'
+
+    def test_01_counters(self, admin_client, user_client, user,
+                         moderator_client, moderator):
+        author_map = {user: user_client, moderator: moderator_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        create_single_comment(
+            user_client, titles[0]['id'], reviews[1]['id'], 'ещё'
+        )
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+
+        counts = {
+            review['id']: review['comments_count']
+            for review in admin_client.get(url).json()['results']
+        }
+        assert counts == {reviews[0]['id']: 2, reviews[1]['id']: 1}, (
+            f'Проверьте, что ответ `{url}` содержит поле `comments_count` '
+            'с числом комментариев к отзыву.'
+        )
+        data = user_client.get(self.ME_URL).json()
+        assert (data['reviews_count'], data['comments_count']) == (1, 2), (
+            f'Проверьте, что ответ `{self.ME_URL}` содержит счётчики '
+            '`reviews_count` и `comments_count`.'
+        )
+
+        response = user_client.patch(
+            self.ME_URL, data={'reviews_count': 100}
+        )
+        assert response.json()['reviews_count'] == 1
+
+        admin_client.delete(f'{url}{reviews[0]["id"]}/')
+        data = user_client.get(self.ME_URL).json()
+        assert (data['reviews_count'], data['comments_count']) == (0, 1), (
+            'Проверьте, что удаление отзыва уменьшает счётчики отзывов и '
+            'комментариев их авторов.'
+        )
+
+        admin_client.delete(f'/api/v1/titles/{titles[0]["id"]}/')
+        for client in (user_client, moderator_client):
+            data = client.get(self.ME_URL).json()
+            assert (data['reviews_count'], data['comments_count']) == (0, 0), (
+                'Проверьте, что удаление произведения обнуляет счётчики '
+                'отзывов и комментариев.'
+            )
+
+    def test_02_recompute_command(self, admin_client, user_client, user,
+                                  moderator_client, moderator):
+        from reviews.models import Review
+        from users.models import User
+
+        author_map = {user: user_client, moderator: moderator_client}
+        create_comments(admin_client, author_map)
+        Review.objects.update(comments_count=0)
+        User.objects.update(reviews_count=0, comments_count=7)
+        call_command('recompute_counters')
+
+        data = user_client.get(self.ME_URL).json()
+        assert (data['reviews_count'], data['comments_count']) == (1, 1), (
+            'Проверьте, что команда `recompute_counters` пересчитывает '
+            'счётчики пользователей.'
+        )
+        assert sorted(
+            Review.objects.values_list('comments_count', flat=True)
+        ) == [0, 2]
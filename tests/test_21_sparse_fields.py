@@ -0,0 +1,108 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments, create_reviews
+
+
+def get_with_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK, (
+        f'Проверьте, что GET-запрос к `{url}` возвращает ответ со статусом '
+        '200.'
+    )
+    return response.json(), [query['sql'] for query in context]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21SparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_title_fields(self, client, admin_client, user, user_client):
+        create_reviews(admin_client, {user: user_client})
+
+        data, queries = get_with_queries(
+            client, f'{self.TITLES_URL}?fields=id,name'
+        )
+        assert all(
+            set(title) == {'id', 'name'} for title in data['results']
+        ), (
+            f'Проверьте, что `{self.TITLES_URL}?fields=` возвращает только '
+            'перечисленные поля.'
+        )
+        assert len(queries) == 2, (
+            'Проверьте, что при `?fields=` без `genre` и `category` не '
+            'выполняются запросы связанных объектов.'
+        )
+        assert '"description"' not in queries[-1]
+        assert 'reviews_category' not in queries[-1]
+
+        data, queries = get_with_queries(
+            client, f'{self.TITLES_URL}?omit=description,category'
+        )
+        assert set(data['results'][0]) == {
+            'id', 'name', 'year', 'rating', 'genre'
+        }
+        assert len(queries) == 3
+        assert data['results'][0]['genre']
+
+        data, queries = get_with_queries(
+            client,
+            f'{self.TITLES_URL}?fields=id&pagination=cursor&ordering=-rating'
+        )
+        assert len(queries) == 1
+        assert set(data['results'][0]) == {'id'}
+
+        response = client.get(f'{self.TITLES_URL}?fields=id,unknown')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_02_other_lists(self, client, admin_client, admin, user,
+                            user_client, moderator, moderator_client):
+        _, reviews, titles = create_comments(admin_client, {
+            user: user_client,
+            moderator: moderator_client,
+            admin: admin_client,
+        })
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/?fields=id,score'
+        data, queries = get_with_queries(client, url)
+        assert set(data['results'][0]) == {'id', 'score'}
+        assert 'users_user' not in queries[-1], (
+            'Проверьте, что при `?fields=` без `author` автор отзыва не '
+            'подгружается.'
+        )
+        assert len(queries) == 3, (
+            'Проверьте, что при `?fields=` число запросов не зависит от '
+            'числа отзывов.'
+        )
+
+        url = (
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}'
+            '/comments/?omit=author'
+        )
+        data, queries = get_with_queries(client, url)
+        assert len(data['results']) == 3
+        assert 'author' not in data['results'][0]
+        assert len(queries) == 3, (
+            'Проверьте, что при `?omit=` число запросов не зависит от '
+            'числа комментариев.'
+        )
+
+        data, queries = get_with_queries(
+            client, '/api/v1/reviews/latest/?omit=title,text'
+        )
+        assert set(data['results'][0]) == {
+            'id', 'author', 'score', 'pub_date', 'comments_count'
+        }
+        assert 'reviews_title' not in queries[-1]
+
+        data, _ = get_with_queries(client, '/api/v1/categories/?fields=slug')
+        assert all(set(category) == {'slug'} for category in data['results'])
+
+        response = client.get(f'/api/v1/titles/{titles[0]["id"]}/?fields=id')
+        assert 'description' in response.json(), (
+            'Проверьте, что `?fields=` применяется только к спискам.'
+        )
@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments, create_single_comment
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22TitleExpand:
+
+    TITLE_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def test_01_expand_reviews_and_comments(self, client, admin_client,
+                                            user, user_client, moderator,
+                                            moderator_client,
+                                            django_assert_num_queries):
+        author_map = {user: user_client, moderator: moderator_client}
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        create_single_comment(
+            user_client, titles[0]['id'], reviews[1]['id'], 'ответ'
+        )
+        url = self.TITLE_URL_TEMPLATE.format(title_id=titles[0]['id'])
+
+        with django_assert_num_queries(4):
+            response = client.get(f'{url}?expand=reviews.comments')
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}?expand=` возвращает ответ '
+            'со статусом 200.'
+        )
+        data = response.json()
+        assert data['name'] == titles[0]['name']
+        assert [review['id'] for review in data['reviews']] == [
+            reviews[0]['id'], reviews[1]['id']
+        ], 'Проверьте, что `?expand=reviews` добавляет отзывы к произведению.'
+        assert [
+            comment['id'] for comment in data['reviews'][0]['comments']
+        ] == [comment['id'] for comment in comments], (
+            'Проверьте, что `?expand=reviews.comments` добавляет комментарии '
+            'к отзывам.'
+        )
+        assert len(data['reviews'][1]['comments']) == 1
+
+        data = client.get(
+            f'{url}?expand=reviews.comments&reviews_limit=1&comments_limit=1'
+        ).json()
+        assert len(data['reviews']) == 1
+        assert [
+            comment['id'] for comment in data['reviews'][0]['comments']
+        ] == [comments[0]['id']], (
+            'Проверьте, что `comments_limit` ограничивает число комментариев '
+            'у каждого отзыва.'
+        )
+
+        with django_assert_num_queries(3):
+            data = client.get(f'{url}?expand=reviews').json()
+        assert 'comments' not in data['reviews'][0]
+        assert 'reviews' not in client.get(url).json()
+
+        for query in ('expand=authors', 'expand=reviews&reviews_limit=0',
+                      'expand=reviews.comments&comments_limit=1000'):
+            response = client.get(f'{url}?{query}')
+            assert response.status_code == HTTPStatus.BAD_REQUEST, query
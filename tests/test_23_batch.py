@@ -0,0 +1,127 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+def post_batch(client, url, batch, **extra):
+    return client.post(
+        url, data=json.dumps(batch), content_type='application/json',
+        **extra
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23Batch:
+
+    BATCH_URL = '/api/v1/batch/'
+
+    def test_01_reads(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = post_batch(
+            client,
+            self.BATCH_URL,
+            [
+                {'url': '/api/v1/titles/?fields=id,name'},
+                {'method': 'GET', 'url': '/api/v1/categories/'},
+                {'url': f'/api/v1/titles/{titles[0]["id"]}/'},
+                {'url': '/api/v1/unknown/'},
+                {'url': '/api/v1/users/me/'},
+            ],
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что POST-запрос к `{self.BATCH_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [item['status'] for item in data] == [200, 200, 200, 404, 401]
+        assert data[0]['body']['count'] == 2
+        assert data[2]['body']['name'] == titles[0]['name'], (
+            f'Проверьте, что `{self.BATCH_URL}` возвращает ответы вложенных '
+            'запросов по порядку.'
+        )
+
+    def test_02_shared_auth_and_writes(self, admin_client, user_client):
+        response = post_batch(
+            admin_client,
+            self.BATCH_URL,
+            [
+                {'method': 'POST', 'url': '/api/v1/genres/',
+                 'body': {'name': 'Вестерн', 'slug': 'western'}},
+                {'url': '/api/v1/genres/'},
+                {'url': '/api/v1/users/me/'},
+            ],
+        )
+        data = response.json()
+        assert [item['status'] for item in data] == [201, 200, 200], (
+            f'Проверьте, что `{self.BATCH_URL}` передаёт аутентификацию '
+            'во вложенные запросы.'
+        )
+        assert [genre['slug'] for genre in data[1]['body']['results']] == [
+            'western'
+        ], 'Проверьте, что чтение после записи видит её результат.'
+        assert data[2]['body']['username'] == 'TestAdmin'
+
+        response = post_batch(
+            user_client,
+            self.BATCH_URL,
+            [{'method': 'DELETE', 'url': '/api/v1/genres/western/'}],
+        )
+        assert response.json()[0]['status'] == HTTPStatus.FORBIDDEN
+
+        response = post_batch(
+            admin_client,
+            self.BATCH_URL,
+            [
+                {'method': 'DELETE', 'url': '/api/v1/genres/western/'},
+                {'url': '/api/v1/genres/'},
+            ],
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что удаление во вложенном запросе к '
+            f'`{self.BATCH_URL}` не ломает пакетный запрос.'
+        )
+        data = response.json()
+        assert data[0] == {'status': HTTPStatus.NO_CONTENT, 'body': None}
+        assert data[1]['body']['results'] == []
+
+    def test_03_msgpack_batch(self, client, admin_client):
+        import msgpack
+
+        create_titles(admin_client)
+        # Готовый ответ списка категорий в MessagePack уже сохранён.
+        client.get('/api/v1/categories/', HTTP_ACCEPT='application/msgpack')
+        batch = [{'url': '/api/v1/categories/'}] * 2
+        response = post_batch(
+            client, self.BATCH_URL, batch, HTTP_ACCEPT='application/msgpack'
+        )
+        assert response['Content-Type'] == 'application/msgpack'
+        data = msgpack.unpackb(response.content)
+        for item in data:
+            assert [
+                category['slug'] for category in item['body']['results']
+            ] == ['books', 'films'], (
+                'Проверьте, что вложенные ответы приходят как данные, '
+                'а не как байты ответа в другом формате.'
+            )
+
+    def test_04_invalid_batches(self, client, settings):
+        settings.BATCH_MAX_REQUESTS = 2
+        invalid = (
+            [],
+            {'url': '/api/v1/titles/'},
+            [{'url': '/api/v1/titles/'}] * 3,
+            [{'url': 'https://example.com/'}],
+            [{'method': 'PUT', 'url': '/api/v1/titles/'}],
+        )
+        for batch in invalid:
+            response = post_batch(client, self.BATCH_URL, batch)
+            assert response.status_code == HTTPStatus.BAD_REQUEST, batch
+        response = post_batch(
+            client, self.BATCH_URL, [{'url': self.BATCH_URL}]
+        )
+        assert response.json()[0]['status'] == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что пакетные запросы нельзя вкладывать друг в друга.'
+        )
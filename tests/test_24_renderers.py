@@ -0,0 +1,90 @@
+import json
+from decimal import Decimal
+from http import HTTPStatus
+from io import StringIO
+
+import msgpack
+import pytest
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24Renderers:
+
+    def test_01_same_output_as_drf(self, client, admin_client, user,
+                                   user_client):
+        _, titles = create_reviews(admin_client, {user: user_client})
+        for url in ('/api/v1/titles/',
+                    f'/api/v1/titles/{titles[0]["id"]}/reviews/'):
+            response = client.get(url)
+            assert response['Content-Type'] == 'application/json'
+            assert response.content == JSONRenderer().render(
+                response.json()
+            ), (
+                f'Проверьте, что ответ `{url}` совпадает побайтно с '
+                'выводом стандартного JSONRenderer.'
+            )
+
+    def test_02_renderer_types(self):
+        from api.renderers import ORJSONRenderer
+
+        data = {'price': Decimal('1.50'), 1: 'line break'}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_03_parser(self, admin_client, user_client, user):
+        _, titles = create_reviews(admin_client, {user: user_client})
+        response = admin_client.post(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+            data=json.dumps({'text': 'Отлично', 'score': 9}),
+            content_type='application/json',
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что API принимает тело запроса в JSON.'
+        )
+        response = admin_client.post(
+            '/api/v1/genres/', data='{"name": ',
+            content_type='application/json',
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_04_benchmark_command(self):
+        out = StringIO()
+        call_command(
+            'benchmark_renderers', page_size=20, repeat=1, stdout=out
+        )
+        lines = out.getvalue().splitlines()
+        assert [line.split()[:2] for line in lines[1:]] == [
+            [page, name]
+            for page in ('titles', 'reviews')
+            for name in ('json', 'orjson', 'msgpack')
+        ]
+
+    def test_05_msgpack(self, client, admin_client, user, user_client):
+        _, titles = create_reviews(admin_client, {user: user_client})
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        response = client.get(url, HTTP_ACCEPT='application/msgpack')
+        assert response['Content-Type'] == 'application/msgpack', (
+            'Проверьте, что API отдаёт MessagePack по заголовку `Accept`.'
+        )
+        assert msgpack.unpackb(response.content) == client.get(url).json()
+
+        response = admin_client.post(
+            url,
+            data=msgpack.packb({'text': 'Отлично', 'score': 9}),
+            content_type='application/msgpack',
+            HTTP_ACCEPT='application/msgpack',
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что API принимает тело запроса в MessagePack.'
+        )
+        assert msgpack.unpackb(response.content)['score'] == 9
+
+        response = admin_client.post(
+            '/api/v1/genres/', data=b'\xc1',
+            content_type='application/msgpack',
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,79 @@
+import gzip
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.fixture
+def compression(settings):
+    from api.middleware import compressed_bodies
+
+    settings.COMPRESSION_MIN_SIZE = 200
+    compressed_bodies.clear()
+    yield compressed_bodies
+    compressed_bodies.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Compression:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_gzip(self, client, admin_client, compression):
+        create_titles(admin_client)
+        plain = client.get(self.TITLES_URL)
+        assert 'Content-Encoding' not in plain
+        assert 'Accept-Encoding' in plain['Vary']
+
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT_ENCODING='br;q=0, gzip, deflate'
+        )
+        assert response['Content-Encoding'] == 'gzip', (
+            'Проверьте, что большие ответы сжимаются, если клиент '
+            'принимает gzip.'
+        )
+        assert gzip.decompress(response.content) == plain.content
+        assert int(response['Content-Length']) == len(response.content)
+
+        small = client.get('/api/v1/genres/?search=нет',
+                           HTTP_ACCEPT_ENCODING='gzip')
+        assert 'Content-Encoding' not in small, (
+            'Проверьте, что ответы меньше COMPRESSION_MIN_SIZE не '
+            'сжимаются.'
+        )
+
+    def test_02_compressed_once(self, client, admin_client, compression,
+                                monkeypatch):
+        from api import middleware
+
+        create_titles(admin_client)
+        calls = []
+        compress_body = middleware.compress_body
+        monkeypatch.setattr(
+            middleware, 'compress_body',
+            lambda content, encoding: calls.append(encoding) or compress_body(
+                content, encoding
+            )
+        )
+        bodies = {
+            client.get(
+                self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip'
+            ).content
+            for _ in range(3)
+        }
+        assert len(bodies) == 1
+        assert calls == ['gzip'], (
+            'Проверьте, что одинаковые ответы сжимаются один раз.'
+        )
+
+    def test_03_brotli(self, client, admin_client, compression):
+        brotli = pytest.importorskip('brotli')
+
+        create_titles(admin_client)
+        plain = client.get(self.TITLES_URL)
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip, br'
+        )
+        assert response['Content-Encoding'] == 'br'
+        assert brotli.decompress(response.content) == plain.content
@@ -0,0 +1,69 @@
+import pytest
+
+from tests.utils import create_comments, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26FastSerializers:
+
+    def test_01_byte_identical_lists(self, client, admin_client, user,
+                                     user_client, moderator,
+                                     moderator_client, settings):
+        from reviews.models import Title
+
+        settings.CATALOG_SNAPSHOTS = False
+        author_map = {user: user_client, moderator: moderator_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        create_single_review(user_client, titles[1]['id'], 'хорошо', 8)
+        Title.objects.create(name='Без категории', year=2001)
+        title_id = titles[0]['id']
+        urls = (
+            '/api/v1/titles/',
+            '/api/v1/titles/?genre=horror&ordering=-rating',
+            '/api/v1/titles/?pagination=cursor&ordering=-reviews_count',
+            '/api/v1/categories/',
+            '/api/v1/genres/?search=Ужасы',
+            f'/api/v1/titles/{title_id}/reviews/',
+            f'/api/v1/titles/{title_id}/reviews/{reviews[0]["id"]}/'
+            'comments/',
+        )
+        for url in urls:
+            settings.FAST_LIST_SERIALIZATION = True
+            fast = client.get(url)
+            settings.FAST_LIST_SERIALIZATION = False
+            slow = client.get(url)
+            assert fast.status_code == slow.status_code == 200
+            assert fast.content == slow.content, (
+                f'Проверьте, что быстрая сериализация `{url}` совпадает '
+                'побайтно с ModelSerializer.'
+            )
+
+    def test_02_serializers(self, admin_client, user, user_client):
+        from api.fast_serializers import (
+            FastCommentSerializer,
+            FastReviewSerializer,
+            FastTitleSerializer,
+        )
+        from api.serializers import (
+            CommentSerializer,
+            ReviewsSerializer,
+            TitleSerializerGet,
+        )
+        from api.views import TitleViewSet
+        from reviews.models import Comment, Review
+
+        create_comments(admin_client, {user: user_client})
+        pairs = (
+            (FastTitleSerializer(), TitleSerializerGet,
+             TitleViewSet.queryset.all()),
+            (FastReviewSerializer(), ReviewsSerializer,
+             Review.objects.select_related('author')),
+            (FastCommentSerializer(), CommentSerializer,
+             Comment.objects.select_related('author')),
+        )
+        for fast, serializer_class, queryset in pairs:
+            expected = serializer_class(queryset, many=True).data
+            assert fast.serialize(fast.rows(queryset)) == expected, (
+                f'Проверьте, что {type(fast).__name__} совпадает с '
+                f'{serializer_class.__name__}.'
+            )
@@ -0,0 +1,90 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27TitleWrite:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_create(self, admin_client, django_assert_num_queries):
+        _, categories, genres = create_titles(admin_client)
+        data = {
+            'name': 'Новое',
+            'year': 2000,
+            'genre': [genres[1]['slug'], genres[0]['slug']],
+            'category': categories[0]['slug'],
+        }
+        with django_assert_num_queries(6):
+            response = admin_client.post(self.TITLES_URL, data=data)
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к `{self.TITLES_URL}` '
+            'возвращает ответ со статусом 201.'
+        )
+        title = response.json()
+        assert title['genre'] == sorted(
+            genres[:2], key=lambda genre: genre['name']
+        ), 'Проверьте, что ответ на POST-запрос содержит жанры произведения.'
+        assert title['category'] == categories[0]
+        assert title['rating'] is None
+        response = admin_client.get(f'{self.TITLES_URL}{title["id"]}/')
+        assert response.json() == title, (
+            'Проверьте, что ответ на POST-запрос совпадает с ответом на '
+            'GET-запрос к произведению.'
+        )
+
+    def test_02_update(self, admin_client, user_client, moderator_client,
+                       django_assert_num_queries):
+        titles, categories, genres = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'отлично', 9)
+        create_single_review(moderator_client, titles[0]['id'], 'плохо', 4)
+        url = f'{self.TITLES_URL}{titles[0]["id"]}/'
+
+        with django_assert_num_queries(4):
+            response = admin_client.patch(url, data={'name': 'Терминатор 2'})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что PATCH-запрос администратора к `{url}` '
+            'возвращает ответ со статусом 200.'
+        )
+        title = response.json()
+        assert title['rating'] == 6, (
+            'Проверьте, что ответ на PATCH-запрос содержит рейтинг '
+            'произведения по его отзывам.'
+        )
+        response = admin_client.get(url)
+        assert response.json() == title
+
+        response = admin_client.patch(
+            url, data={'genre': [genres[2]['slug']], 'category': 'books'}
+        )
+        title = response.json()
+        assert title['genre'] == genres[2:]
+        assert title['category'] == categories[1]
+        response = admin_client.get(url)
+        assert response.json() == title, (
+            'Проверьте, что ответ на PATCH-запрос совпадает с ответом на '
+            'GET-запрос к произведению.'
+        )
+
+    def test_03_genres_sorted_by_name(self, client, admin_client,
+                                      settings):
+        from reviews.models import Genre, Title
+
+        title = Title.objects.create(name='Жанры', year=2000)
+        for slug in ('zeta', 'alpha', 'mid'):
+            title.genre.add(Genre.objects.create(name=slug, slug=slug))
+        url = f'{self.TITLES_URL}{title.id}/'
+        for fast in (True, False):
+            settings.FAST_LIST_SERIALIZATION = fast
+            titles = client.get(self.TITLES_URL).json()['results']
+            for data in (titles[0], client.get(url).json()):
+                assert [genre['slug'] for genre in data['genre']] == [
+                    'alpha', 'mid', 'zeta'
+                ], 'Проверьте, что жанры произведения отсортированы по имени.'
+        response = admin_client.patch(url, data={'year': 2001})
+        assert [genre['slug'] for genre in response.json()['genre']] == [
+            'alpha', 'mid', 'zeta'
+        ]
@@ -0,0 +1,65 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28SlugMaps:
+
+    TITLES_URL = '/api/v1/titles/'
+    GENRES_URL = '/api/v1/genres/'
+
+    def test_01_slug_map_reloads(self, django_assert_num_queries):
+        from reviews.models import Genre
+        from reviews.slugs import genre_slugs
+
+        genre = Genre.objects.create(name='Ужасы', slug='horror')
+        assert genre_slugs.ids(['horror', 'unknown']) == [genre.pk]
+        with django_assert_num_queries(0):
+            assert genre_slugs.get('horror').name == 'Ужасы', (
+                'Проверьте, что slug жанра находится без запроса к базе.'
+            )
+        Genre.objects.filter(pk=genre.pk).delete()
+        other = Genre.objects.create(name='Драма', slug='drama')
+        assert genre_slugs.ids(['horror', 'drama']) == [other.pk], (
+            'Проверьте, что карта slug перечитывается после изменения '
+            'жанров.'
+        )
+
+    def test_02_title_writes_and_filters(self, client, admin_client):
+        titles, categories, _ = create_titles(admin_client)
+        response = admin_client.post(
+            self.GENRES_URL, data={'name': 'Мюзикл', 'slug': 'musical'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        data = {
+            'name': 'Новое',
+            'year': 2000,
+            'genre': ['musical'],
+            'category': categories[0]['slug'],
+        }
+        response = admin_client.post(self.TITLES_URL, data=data)
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что новый жанр можно сразу указать у произведения.'
+        )
+        title_id = response.json()['id']
+        response = client.get(f'{self.TITLES_URL}?genre=musical')
+        assert [title['id'] for title in response.json()['results']] == [
+            title_id
+        ], 'Проверьте, что фильтр по новому жанру находит произведение.'
+
+        admin_client.delete(f'{self.GENRES_URL}musical/')
+        response = admin_client.patch(
+            f'{self.TITLES_URL}{titles[0]["id"]}/', data={'genre': ['musical']}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что удалённый жанр нельзя указать у произведения.'
+        )
+        response = admin_client.patch(
+            f'{self.TITLES_URL}{titles[0]["id"]}/',
+            data={'category': ['films']},
+            format='json',
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,67 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29CatalogSnapshots:
+
+    GENRES_URL = '/api/v1/genres/'
+    CATEGORIES_URL = '/api/v1/categories/'
+
+    def test_01_snapshot_served_without_queries(self, client, admin_client,
+                                                django_assert_num_queries):
+        create_genre(admin_client)
+        for url in (self.GENRES_URL, f'{self.GENRES_URL}?search=Драма'):
+            first = client.get(url)
+            assert first.status_code == HTTPStatus.OK
+            with django_assert_num_queries(0):
+                second = client.get(url)
+            assert second.status_code == HTTPStatus.OK, (
+                f'Проверьте, что GET-запрос к `{url}` возвращает ответ '
+                'со статусом 200.'
+            )
+            assert second.content == first.content, (
+                f'Проверьте, что повторный GET-запрос к `{url}` отдаёт '
+                'готовый ответ без запросов к базе.'
+            )
+            assert second['Content-Type'] == first['Content-Type']
+        assert client.get(
+            f'{self.GENRES_URL}?search=Драма'
+        ).json()['results'] == [{'name': 'Драма', 'slug': 'drama'}]
+
+        response = client.get(
+            self.GENRES_URL, HTTP_ACCEPT='application/msgpack'
+        )
+        assert response['Content-Type'] == 'application/msgpack', (
+            'Проверьте, что готовые ответы хранятся отдельно для каждого '
+            'формата.'
+        )
+
+    def test_02_snapshot_expires_on_writes(self, client, admin_client):
+        data = {'name': 'Фильм', 'slug': 'films'}
+        admin_client.post(self.CATEGORIES_URL, data=data)
+        assert client.get(self.CATEGORIES_URL).json()['results'] == [data]
+
+        admin_client.post(
+            self.CATEGORIES_URL, data={'name': 'Книга', 'slug': 'books'}
+        )
+        response = client.get(self.CATEGORIES_URL)
+        assert [
+            category['slug'] for category in response.json()['results']
+        ] == ['books', 'films'], (
+            'Проверьте, что новая категория сразу появляется в списке.'
+        )
+
+        admin_client.delete(f'{self.CATEGORIES_URL}films/')
+        response = client.get(self.CATEGORIES_URL)
+        assert [
+            category['slug'] for category in response.json()['results']
+        ] == ['books'], (
+            'Проверьте, что удалённая категория сразу пропадает из списка.'
+        )
+
+        response = client.get(f'{self.CATEGORIES_URL}?page=5')
+        assert response.status_code == HTTPStatus.NOT_FOUND
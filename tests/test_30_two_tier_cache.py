@@ -0,0 +1,102 @@
+import os
+from http import HTTPStatus
+
+import pytest
+
+
+def make_cache(location, **options):
+    from api_yamdb.cache import TwoTierCache
+
+    options.setdefault('L1_MAX_ENTRIES', 2)
+    return TwoTierCache(str(location), {'OPTIONS': options})
+
+
+def make_worker(location):
+    # Отдельный TwoTierStore на том же каталоге ведёт себя как другой
+    # процесс: своя память L1, общие L2 и файл счётчиков.
+    from api_yamdb.cache import TwoTierStore
+
+    cache = make_cache(location)
+    cache.store = TwoTierStore(str(location), {'L1_MAX_ENTRIES': 2})
+    return cache
+
+
+class Test30TwoTierCache:
+
+    def test_01_cache_api(self, tmp_path):
+        cache = make_cache(tmp_path)
+        assert cache.get('missing', 'default') == 'default'
+        cache.set('key', {'value': [1, 2]})
+        assert cache.get('key') == {'value': [1, 2]}
+        assert cache.add('key', 'other') is False
+        assert cache.add('new', 1, None) is True
+        assert cache.incr('new', 5) == 6
+        assert cache.get('new') == 6
+        with pytest.raises(ValueError):
+            cache.incr('missing')
+        cache.set('expired', 1, 0)
+        assert cache.get('expired') is None
+        assert cache.add('expired', 2) is True
+        assert cache.delete('key') is True
+        assert cache.has_key('key') is False
+        cache.clear()
+        assert cache.get('new') is None
+
+    def test_02_l1_metrics(self, tmp_path):
+        cache = make_cache(tmp_path)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+        assert cache.get('a') == 'a'
+        assert cache.get('a') == 'a'
+        cache.get('b')
+        cache.get('c')
+        cache.get('missing')
+        stats = cache.stats()
+        assert (
+            stats['l1_hits'], stats['l2_hits'], stats['misses'],
+            stats['evictions'], stats['l1_entries'], stats['l2_entries'],
+        ) == (1, 3, 1, 1, 2, 3), (
+            'Проверьте, что кэш считает попадания в L1 и L2, промахи и '
+            'вытеснения из L1.'
+        )
+
+    def test_03_invalidation_across_workers(self, tmp_path):
+        first, second = make_worker(tmp_path), make_worker(tmp_path)
+        first.set('key', 1)
+        assert first.get('key') == 1
+        assert second.get('key') == 1
+        second.set('key', 2)
+        assert first.get('key') == 2, (
+            'Проверьте, что запись в одном процессе делает устаревшей '
+            'копию ключа в L1 других процессов.'
+        )
+        assert first.stats()['invalidations'] == 1
+        second.incr('key')
+        assert first.get('key') == 3
+        second.clear()
+        assert first.get('key') is None
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='нужен fork')
+    def test_04_invalidation_across_processes(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set('key', 'old')
+        assert cache.get('key') == 'old'
+        pid = os.fork()
+        if pid == 0:
+            try:
+                cache.set('key', 'new')
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        assert cache.get('key') == 'new'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_stats_endpoint(self, admin_client, user_client):
+        url = '/api/v1/cache/'
+        response = admin_client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос администратора к `{url}` '
+            'возвращает ответ со статусом 200.'
+        )
+        assert response.json()['pid'] == os.getpid()
+        assert user_client.get(url).status_code == HTTPStatus.FORBIDDEN